@@ -1,39 +1,50 @@
 # app.py - Simple FastAPI server to get started
-from fastapi import FastAPI, HTTPException, Depends, Request
+from fastapi import FastAPI, HTTPException, Depends, Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse, FileResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response
 from fastapi.staticfiles import StaticFiles
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 from typing import List, Optional
 import os
+import sys
+import asyncio
+import time
+import hashlib
 from pathlib import Path
 
 # Import our models and database
-from app.core.database import SessionLocal, engine, Base
+from app.core.database import SessionLocal
 from app.models.user import User
-from app.models.product import Product
+from app.models.product import Product, ProductStatus
 from app.core.security import SecurityManager
 
-# Create tables
-Base.metadata.create_all(bind=engine)
+# Tables are created once at deploy time, not on every import/worker start:
+# python main_dashboard_init.py initdb (or app.core.database.create_tables())
 
 # Create FastAPI app
 app = FastAPI(
     title="AI Live Commerce Platform",
     version="1.0.0",
-    description="Multi-platform AI-powered live commerce system"
+    description="Multi-platform AI-powered live commerce system",
+    default_response_class=ORJSONResponse
 )
 
-# Add CORS middleware
+# Add CORS middleware; an explicit allowlist lets browsers cache preflights
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=os.getenv("CORS_ORIGINS", "http://localhost:8000").split(","),
     allow_credentials=True,
-    allow_methods=["*"],
+    allow_methods=["GET", "POST", "DELETE"],
     allow_headers=["*"],
+    max_age=86400,
 )
 
+# Compress HTML pages and JSON bodies; tiny responses aren't worth the CPU
+app.add_middleware(GZipMiddleware, minimum_size=500)
+
 # Dependency to get DB session
 def get_db():
     db = SessionLocal()
@@ -72,13 +83,35 @@ class LoginResponse(BaseModel):
     message: str
     username: Optional[str] = None
 
+# HTML pages are read once at import and served from memory; they only change on redeploy
+PAGE_CACHE_CONTROL = "public, max-age=300"
+
+def _load_page(path: str):
+    """(bytes, ETag) for an HTML page, or None if the file is missing"""
+    page = Path(path)
+    if not page.exists():
+        return None
+    body = page.read_bytes()
+    return body, '"%s"' % hashlib.md5(body, usedforsecurity=False).hexdigest()
+
+_STATIC_PAGES = {
+    "index": _load_page("frontend/index.html"),
+    "avatar": _load_page("frontend/avatar.html"),
+}
+
+def _page_response(request: Request, key: str) -> Response:
+    body, etag = _STATIC_PAGES[key]
+    headers = {"ETag": etag, "Cache-Control": PAGE_CACHE_CONTROL}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return HTMLResponse(content=body, headers=headers)
+
 # API Routes
 @app.get("/")
-async def root():
+async def root(request: Request):
     """Serve the main dashboard"""
-    index_path = Path("frontend/index.html")
-    if index_path.exists():
-        return FileResponse(str(index_path))
+    if _STATIC_PAGES["index"]:
+        return _page_response(request, "index")
     return HTMLResponse(content="""
     <html>
         <head>
@@ -154,41 +187,85 @@ async def health_check():
         "version": "1.0.0"
     }
 
-@app.get("/api/products", response_model=List[ProductResponse])
+# The active product list is read far more often than it changes; keep the
+# serialized rows for a few seconds and drop them on every write
+PRODUCTS_CACHE_TTL = 10.0
+_products_cache = None  # (expires_at, List[dict])
+
+# Product columns mapped onto ProductResponse fields, selected directly so no
+# ORM objects are built
+_PRODUCT_COLUMNS = (
+    Product.id, Product.name, Product.price, Product.description,
+    Product.key_features.label("features"), Product.stock_quantity.label("stock"),
+    Product.category, Product.sku,
+)
+
+def _invalidate_products_cache():
+    global _products_cache
+    _products_cache = None
+
+@app.get("/api/products")
 async def get_products(db: Session = Depends(get_db)):
     """Get all products"""
-    products = db.query(Product).filter(Product.is_active == True).all()
-    return products
+    global _products_cache
+    now = time.monotonic()
+    if _products_cache is None or now >= _products_cache[0]:
+        rows = await asyncio.to_thread(
+            db.query(*_PRODUCT_COLUMNS).filter(Product.status == ProductStatus.ACTIVE).all
+        )
+        products = []
+        for row in rows:
+            product = row._asdict()
+            product["id"] = str(product["id"])
+            product["price"] = float(product["price"])  # DECIMAL -> JSON number
+            product["features"] = product["features"] or []
+            product["is_active"] = True  # only ACTIVE rows are selected
+            products.append(product)
+        _products_cache = (now + PRODUCTS_CACHE_TTL, products)
+    return ORJSONResponse(_products_cache[1])
+
+# The demo user never changes once created; look its id up once per process
+_demo_user_id = None
 
+def _get_demo_user_id(db: Session) -> Optional[str]:
+    global _demo_user_id
+    if _demo_user_id is None:
+        demo_user = db.query(User.id).filter(User.username == "demo").first()
+        if demo_user:
+            _demo_user_id = demo_user.id
+    return _demo_user_id
+
+# The Session is sync; plain def handlers run in the threadpool so queries
+# and commits never block the event loop
 @app.post("/api/products", response_model=ProductResponse)
-async def create_product(
+def create_product(
     product: ProductCreate,
     db: Session = Depends(get_db)
 ):
     """Create a new product"""
     # For now, use the demo user
-    demo_user = db.query(User).filter(User.username == "demo").first()
-    if not demo_user:
+    demo_user_id = _get_demo_user_id(db)
+    if demo_user_id is None:
         raise HTTPException(status_code=404, detail="Demo user not found")
     
-    # Check if SKU exists
-    existing = db.query(Product).filter(Product.sku == product.sku).first()
-    if existing:
-        raise HTTPException(status_code=400, detail="Product with this SKU already exists")
-    
-    # Create product
+    # Create product; the unique index on sku rejects duplicates at commit
     db_product = Product(
         **product.dict(),
-        user_id=demo_user.id
+        user_id=demo_user_id
     )
     db.add(db_product)
-    db.commit()
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(status_code=400, detail="Product with this SKU already exists")
     db.refresh(db_product)
+    _invalidate_products_cache()
     
     return db_product
 
 @app.get("/api/products/{product_id}", response_model=ProductResponse)
-async def get_product(product_id: str, db: Session = Depends(get_db)):
+def get_product(product_id: str, db: Session = Depends(get_db)):
     """Get a specific product"""
     product = db.query(Product).filter(Product.id == product_id).first()
     if not product:
@@ -196,19 +273,20 @@ async def get_product(product_id: str, db: Session = Depends(get_db)):
     return product
 
 @app.delete("/api/products/{product_id}")
-async def delete_product(product_id: str, db: Session = Depends(get_db)):
+def delete_product(product_id: str, db: Session = Depends(get_db)):
     """Delete a product (soft delete)"""
     product = db.query(Product).filter(Product.id == product_id).first()
     if not product:
         raise HTTPException(status_code=404, detail="Product not found")
     
-    product.is_active = False
+    product.status = ProductStatus.INACTIVE
     db.commit()
+    _invalidate_products_cache()
     
     return {"message": "Product deleted successfully"}
 
 @app.post("/api/login", response_model=LoginResponse)
-async def login(credentials: UserLogin, db: Session = Depends(get_db)):
+def login(credentials: UserLogin, db: Session = Depends(get_db)):
     """Simple login check (for demo)"""
     user = db.query(User).filter(User.username == credentials.username).first()
     
@@ -248,11 +326,10 @@ async def mock_facebook_connect():
 
 # Add Avatar endpoints
 @app.get("/avatar")
-async def avatar_viewer():
+async def avatar_viewer(request: Request):
     """Serve avatar viewer page"""
-    avatar_path = Path("frontend/avatar.html")
-    if avatar_path.exists():
-        return FileResponse(str(avatar_path))
+    if _STATIC_PAGES["avatar"]:
+        return _page_response(request, "avatar")
     return HTMLResponse("<h1>Avatar viewer not found</h1>")
 
 @app.websocket("/ws/avatar")
@@ -291,4 +368,13 @@ if __name__ == "__main__":
     print("📚 API Docs at: http://localhost:8000/docs")
     print("\nPress CTRL+C to stop\n")
     
-    uvicorn.run(app, host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
+    # "app:app" would resolve to the app/ package, so this launcher can only
+    # pass the object: single worker, no reload. Multi-worker serving is
+    # run_server.py's job.
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=8000,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+    )
\ No newline at end of file
@@ -5,11 +5,14 @@ Handles products, scripts, AI generation, MP3 creation, and personas
 FIXED VERSION - All original functions preserved with proper imports
 """
 
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, BackgroundTasks, Request
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from sqlalchemy import func, desc, asc
 from typing import List, Optional, Dict, Any
 from pydantic import BaseModel, Field
+import asyncio
+import functools
 import json
 import os
 from datetime import datetime, timedelta
@@ -27,13 +30,22 @@ except ImportError as e:
     print(f"⚠️ Could not import AI Script Service: {e}")
     ai_script_service = None
 
-try:
-    from app.services.enhanced_tts_service import enhanced_tts_service as tts_service
-    print("✅ Enhanced TTS Service imported successfully")
-except ImportError as e:
-    print(f"⚠️ Could not import Enhanced TTS Service: {e}")
-    from app.services.tts_service import tts_service
-    print("✅ Fallback to basic TTS Service")
+@functools.lru_cache(maxsize=None)
+def get_tts_service():
+    """TTS service, imported on first use.
+
+    The enhanced service pulls in Edge/Azure/ElevenLabs and pydub at import,
+    so it is loaded by the first TTS request instead of at server startup.
+    """
+    try:
+        from app.services.enhanced_tts_service import enhanced_tts_service
+        print("✅ Enhanced TTS Service imported successfully")
+        return enhanced_tts_service
+    except ImportError as e:
+        print(f"⚠️ Could not import Enhanced TTS Service: {e}")
+        from app.services.tts_service import tts_service
+        print("✅ Fallback to basic TTS Service")
+        return tts_service
 
 try:
     from app.utils.file_handler import file_handler
@@ -253,6 +265,73 @@ async def get_ai_service_status():
             "mode": "simulation"
         }
 
+# Seconds between AI status checks on the stream
+AI_STATUS_STREAM_INTERVAL = 30
+
+# One producer checks the status for every open stream and fans it out
+_ai_status_subscribers: set = set()
+_ai_status_last: Optional[str] = None
+_ai_status_task: Optional[asyncio.Task] = None
+
+async def _check_ai_status() -> Dict[str, Any]:
+    """AI status for the stream, via the no-cost model lookup"""
+    if not ai_script_service:
+        return {"status": "unavailable", "mode": "simulation", "message": "AI Script Service not loaded"}
+    check = await ai_script_service.check_openai_status()
+    return {
+        "status": "available" if check["status"] == "connected" else check["status"],
+        "mode": "openai" if check["status"] == "connected" else "simulation",
+        "message": check["message"]
+    }
+
+async def _ai_status_producer():
+    """Check once per interval while anyone is subscribed; publish only when status/mode change"""
+    global _ai_status_last, _ai_status_task
+    last_key = None
+    try:
+        while _ai_status_subscribers:
+            status = await _check_ai_status()
+            key = (status["status"], status["mode"])
+            if key != last_key:
+                last_key = key
+                _ai_status_last = json.dumps(status, ensure_ascii=False, default=str)
+                for queue in _ai_status_subscribers:
+                    queue.put_nowait(_ai_status_last)
+            await asyncio.sleep(AI_STATUS_STREAM_INTERVAL)
+    finally:
+        _ai_status_last = None
+        _ai_status_task = None
+
+@router.get("/stream/ai-status")
+async def stream_ai_service_status(request: Request):
+    """Server-Sent Events stream of AI service status, pushed only on change"""
+    global _ai_status_task
+    
+    queue: asyncio.Queue = asyncio.Queue()
+    if _ai_status_last is not None:
+        queue.put_nowait(_ai_status_last)
+    _ai_status_subscribers.add(queue)
+    if _ai_status_task is None:
+        _ai_status_task = asyncio.create_task(_ai_status_producer())
+    
+    async def event_stream():
+        try:
+            while not await request.is_disconnected():
+                try:
+                    payload = await asyncio.wait_for(queue.get(), AI_STATUS_STREAM_INTERVAL)
+                    yield f"data: {payload}\n\n"
+                except asyncio.TimeoutError:
+                    # SSE comment line; keeps proxies from closing an idle stream
+                    yield ": keep-alive\n\n"
+        finally:
+            _ai_status_subscribers.discard(queue)
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 # Product Management Endpoints
 @router.get("/dashboard/products")
 async def get_products(
@@ -721,6 +800,7 @@ async def generate_mp3(request: MP3GenerationRequest, background_tasks: Backgrou
 
 async def _generate_mp3_background(script_ids: List[int], voice_persona_id: int, quality: str, db_session: Session):
     """Enhanced background task for MP3 generation with emotional support and clean metadata"""
+    tts_service = get_tts_service()
     from app.core.database import SessionLocal
     db = SessionLocal()
     
@@ -770,7 +850,7 @@ async def _generate_mp3_background(script_ids: List[int], voice_persona_id: int,
                     if hasattr(tts_service, 'generate_emotional_speech'):
                         # ใช้ Enhanced TTS Service
                         file_path, web_url = await tts_service.generate_emotional_speech(
-                            text=script.content,
+                            text=script.plain_content,  # {emotion} markup is not spoken
                             script_id=str(script.id),
                             provider=voice_persona.tts_provider,
                             voice_config=voice_config,
@@ -783,7 +863,7 @@ async def _generate_mp3_background(script_ids: List[int], voice_persona_id: int,
                         # Fallback to basic TTS
                         file_path, web_url = await tts_service.generate_script_audio(
                             script_id=str(script.id),
-                            content=script.content,
+                            content=script.plain_content,
                             language=getattr(script, 'language', 'th'),
                             voice_persona=voice_config
                         )
@@ -883,6 +963,7 @@ async def _generate_mp3_background(script_ids: List[int], voice_persona_id: int,
 @router.get("/dashboard/tts/providers")
 async def get_tts_providers():
     """Get available TTS providers and their capabilities"""
+    tts_service = get_tts_service()
     try:
         if hasattr(tts_service, 'get_available_providers'):
             providers = tts_service.get_available_providers()
@@ -916,6 +997,7 @@ async def test_tts_generation(
     voice_id: Optional[str] = None
 ):
     """Test TTS generation with contamination prevention - FIXED VERSION"""
+    tts_service = get_tts_service()
     try:
         print(f"🧪 TTS Test Request Received:")
         print(f"   📝 Text parameter: '{text}'")
@@ -997,6 +1079,7 @@ async def test_tts_generation(
 @router.get("/dashboard/tts/emotions/{provider}")
 async def get_supported_emotions(provider: str):
     """Get supported emotions for a TTS provider"""
+    tts_service = get_tts_service()
     try:
         if hasattr(tts_service, 'get_emotions_for_provider'):
             emotions = tts_service.get_emotions_for_provider(provider)
@@ -1417,4 +1500,13 @@ async def export_data(
         return export_data
         
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error exporting data: {str(e)}")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"Error exporting data: {str(e)}")
+
+# Upload processing status - polls queued image jobs
+@router.get("/dashboard/uploads/status/{filename}")
+async def get_upload_status(filename: str):
+    """Get status of a queued image upload processing job"""
+    if not hasattr(file_handler, 'get_upload_status'):
+        raise HTTPException(status_code=503, detail="File handler not available")
+    
+    return file_handler.get_upload_status(filename)
@@ -4,11 +4,16 @@ Facebook API Router with Real OAuth Integration
 รองรับการเชื่อมต่อ Facebook จริงผ่าน OAuth 2.0
 """
 
-from fastapi import APIRouter, HTTPException, Query
-from fastapi.responses import JSONResponse, RedirectResponse
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import JSONResponse, RedirectResponse, StreamingResponse
 from pydantic import BaseModel
 from typing import Optional, Dict, List
+import asyncio
+import json
 import logging
+import random
+import secrets
+from datetime import datetime
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
@@ -269,9 +274,6 @@ async def create_live_video(live_data: LiveVideoCreate):
             return result
         else:
             # Fallback live video creation
-            import secrets
-            from datetime import datetime
-            
             live_video = {
                 "id": f"fallback_live_{secrets.token_hex(8)}",
                 "title": live_data.title,
@@ -325,10 +327,6 @@ async def get_live_comments():
             return result
         else:
             # Fallback mock comments
-            import random
-            import secrets
-            from datetime import datetime
-            
             if random.random() < 0.3:  # 30% chance
                 mock_comments = [
                     {
@@ -349,6 +347,30 @@ async def get_live_comments():
         logger.error(f"Get comments error: {str(e)}")
         return {"success": True, "comments": []}
 
+# Seconds between comment checks on the stream (jittered so clients don't poll in lockstep)
+COMMENT_STREAM_INTERVAL = (2.0, 5.0)
+
+@router.get("/live/comments/stream")
+async def stream_live_comments(request: Request):
+    """Server-Sent Events stream of live comments; /live/comments stays as the polling fallback"""
+    
+    async def event_stream():
+        while not await request.is_disconnected():
+            result = await get_live_comments()
+            comments = result.get("comments") or []
+            for comment in comments:
+                yield f"data: {json.dumps(comment, ensure_ascii=False, default=str)}\n\n"
+            if not comments:
+                # SSE comment line; keeps proxies from closing an idle stream
+                yield ": keep-alive\n\n"
+            await asyncio.sleep(random.uniform(*COMMENT_STREAM_INTERVAL))
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @router.post("/live/comment")
 async def post_live_comment(comment_data: FacebookComment):
     """Post a comment to current live video"""
@@ -357,7 +379,6 @@ async def post_live_comment(comment_data: FacebookComment):
             result = await facebook_service.post_comment(comment_data.message)
             return result
         else:
-            import secrets
             return {
                 "success": True,
                 "comment_id": f"fallback_comment_{secrets.token_hex(8)}",
@@ -7,6 +7,8 @@ Fixed router prefix and error handling
 from fastapi import APIRouter, HTTPException, Depends
 from pydantic import BaseModel
 from typing import Dict, Any, Optional
+import asyncio
+import random
 
 # Import with error handling
 try:
@@ -19,7 +21,7 @@ except ImportError as e:
 # Optional database import
 try:
     from app.core.database import get_db
-    from app.models.product import Product
+    from app.models.product import Product, ProductStatus
     from sqlalchemy.orm import Session
     database_available = True
 except ImportError as e:
@@ -27,6 +29,7 @@ except ImportError as e:
     database_available = False
     get_db = None
     Product = None
+    ProductStatus = None
     Session = None
 
 # FIXED: Use only /api/integration prefix (remove double prefix)
@@ -223,7 +226,6 @@ async def present_random_product(db: Session = Depends(get_db) if database_avail
     try:
         if not live_orchestrator:
             # Mock random product
-            import random
             mock_products = [
                 {'id': '1', 'name': 'AI Smart Camera', 'price': 2999.0},
                 {'id': '2', 'name': 'Wireless Earbuds Pro', 'price': 1599.0},
@@ -240,7 +242,6 @@ async def present_random_product(db: Session = Depends(get_db) if database_avail
         
         if not database_available or not db:
             # Mock random product
-            import random
             mock_products = [
                 {'id': '1', 'name': 'AI Smart Camera', 'price': 2999.0, 'description': 'กล้องอัจฉริยะ AI ติดตามวัตถุอัตโนมัติ'},
                 {'id': '2', 'name': 'Wireless Earbuds Pro', 'price': 1599.0, 'description': 'หูฟังไร้สาย เสียงใส ใช้งานได้ 24 ชม.'},
@@ -262,9 +263,8 @@ async def present_random_product(db: Session = Depends(get_db) if database_avail
                 }
             }
         
-        # Real database query
-        import random
-        products = db.query(Product).filter(Product.is_active == True).all()
+        # Real database query, off the event loop (sync Session)
+        products = await asyncio.to_thread(db.query(Product).filter(Product.status == ProductStatus.ACTIVE).all)
         if not products:
             raise HTTPException(status_code=404, detail="No products available")
         
@@ -381,7 +381,6 @@ async def run_full_demo():
             raise HTTPException(status_code=500, detail="Could not start session")
         
         # Wait a bit
-        import asyncio
         await asyncio.sleep(2)
         
         # Present a mock product
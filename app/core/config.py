@@ -91,6 +91,7 @@ class Settings(BaseSettings):
     UPLOAD_DIR: Path = Path("./frontend/uploads")
     STATIC_DIR: Path = Path("./frontend/static")
     AUDIO_DIR: Path = Path("./frontend/static/audio")
+    SERVE_STATIC: bool = True  # False when a reverse proxy (nginx.conf) serves /static and /uploads
     MAX_UPLOAD_SIZE: int = 50 * 1024 * 1024  # 50 MB
     ALLOWED_EXTENSIONS: List[str] = [".jpg", ".jpeg", ".png", ".mp4", ".gif", ".mp3", ".wav"]
     
@@ -1,24 +1,85 @@
 #app/core/database.py
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import QueuePool, StaticPool
 import os
+import json
 from typing import Generator
 
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./ai_live_commerce.db")
+# Log emitted SQL, e.g. to confirm seeds go out as multi-row INSERT ... VALUES
+DATABASE_ECHO = os.getenv("DATABASE_ECHO", "false").lower() in ("1", "true", "yes")
+
+# Connection pool sizing, shared by every engine flavour. Each worker process
+# keeps its own pool, sized for the threadpool's concurrent sync handlers.
+POOL_SIZE = int(os.getenv("POOL_SIZE", 20))
+POOL_MAX_OVERFLOW = int(os.getenv("POOL_MAX_OVERFLOW", 10))
+# Pre-ping costs a SELECT 1 per checkout; only worth it behind a proxy or
+# load balancer that drops idle connections (pool_recycle covers the rest)
+POOL_PRE_PING = os.getenv("POOL_PRE_PING", "false").lower() in ("1", "true", "yes")
+
+_pool_kwargs = {
+    "poolclass": QueuePool,
+    "pool_size": POOL_SIZE,
+    "max_overflow": POOL_MAX_OVERFLOW,
+    "pool_timeout": 30,
+    "pool_recycle": 1800,
+    "pool_pre_ping": POOL_PRE_PING,
+}
+
+def _json_serializer(obj) -> str:
+    """Compact JSON that keeps Thai text as UTF-8 instead of \\uXXXX escapes"""
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
 
 # For SQLite
 if DATABASE_URL.startswith("sqlite"):
+    if ":memory:" in DATABASE_URL:
+        # In-memory databases only exist on a single connection
+        _pool_kwargs = {"poolclass": StaticPool}
     engine = create_engine(
         DATABASE_URL,
         connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
+        echo=DATABASE_ECHO,
+        # Multi-row VALUES pages of 500 rows line up with the seed batch size
+        # and stay under the 999-parameter limit of older SQLite builds
+        insertmanyvalues_page_size=500,
+        json_serializer=_json_serializer,
+        json_deserializer=json.loads,
+        **_pool_kwargs,
+    )
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """WAL + relaxed fsync so commits (and seeding) don't stall on disk syncs"""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-65536")
+        cursor.close()
+elif DATABASE_URL.startswith("postgresql"):
+    # psycopg2: batch executemany() via execute_values / execute_batch
+    engine = create_engine(
+        DATABASE_URL,
+        executemany_mode="values_plus_batch",
+        echo=DATABASE_ECHO,
+        insertmanyvalues_page_size=1000,
+        json_serializer=_json_serializer,
+        json_deserializer=json.loads,
+        **_pool_kwargs,
     )
 else:
-    # For PostgreSQL or MySQL
-    engine = create_engine(DATABASE_URL, pool_pre_ping=True)
+    # For MySQL
+    engine = create_engine(
+        DATABASE_URL,
+        echo=DATABASE_ECHO,
+        insertmanyvalues_page_size=1000,
+        json_serializer=_json_serializer,
+        json_deserializer=json.loads,
+        **_pool_kwargs,
+    )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
@@ -42,4 +103,7 @@ def get_db_session():
 
 def create_tables():
     """Create all database tables"""
-    Base.metadata.create_all(bind=engine)
\ No newline at end of file
+    # Models are declared on app.models.base.Base; importing the package
+    # registers every table on its metadata exactly once.
+    from app.models import Base as ModelBase
+    ModelBase.metadata.create_all(bind=engine)
\ No newline at end of file
@@ -0,0 +1,46 @@
+# app/core/health_interceptor.py
+"""
+Pure ASGI fast path for monitoring endpoints (health/performance probes)
+"""
+
+from typing import Any, Awaitable, Callable, Dict
+
+import orjson
+
+_JSON_HEADERS = [(b"content-type", b"application/json")]
+_NOT_ALLOWED_HEADERS = [(b"allow", b"GET"), (b"content-type", b"application/json")]
+_NOT_ALLOWED_BODY = orjson.dumps({"detail": "Method Not Allowed"})
+
+class HealthCheckInterceptor:
+    """Answer probe paths before the FastAPI stack (middleware, routing,
+    response validation) and hand every other request to the wrapped app.
+
+    handlers maps a path to a zero-argument coroutine function returning a
+    JSON-serializable payload; the same functions can stay registered as
+    FastAPI routes so they still appear in /docs.
+    """
+
+    def __init__(self, app, handlers: Dict[str, Callable[[], Awaitable[Any]]]):
+        self.app = app
+        self.handlers = handlers
+
+    async def __call__(self, scope, receive, send):
+        handler = self.handlers.get(scope["path"]) if scope["type"] == "http" else None
+        if handler is None:
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "GET":
+            status, headers, body = 200, _JSON_HEADERS, orjson.dumps(await handler())
+        else:
+            status, headers, body = 405, _NOT_ALLOWED_HEADERS, _NOT_ALLOWED_BODY
+
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": headers + [(b"content-length", str(len(body)).encode())],
+        })
+        await send({
+            "type": "http.response.body",
+            "body": body,
+        })
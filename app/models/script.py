@@ -8,8 +8,12 @@ from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, Enum, F
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import enum
+import re
 from .base import Base
 
+# Inline emotion markup used in script content, e.g. {excited}...{/excited}
+EMOTION_TAG_RE = re.compile(r"\{/?[a-z]+\}")
+
 class ScriptType(enum.Enum):
     MANUAL = "manual"
     AI_GENERATED = "ai_generated"
@@ -112,6 +116,11 @@ class Script(Base):
         """Get persona name if exists"""
         return self.persona.name if self.persona else None
     
+    @property
+    def plain_content(self):
+        """Content with {emotion} markup stripped"""
+        return EMOTION_TAG_RE.sub("", self.content) if self.content else ""
+    
     @property
     def word_count(self):
         """Count words in content"""
@@ -772,6 +772,29 @@ class AIScriptService:
                 "details": "Please check your API key and internet connection"
             }
 
+    
+    async def check_openai_status(self) -> Dict[str, Any]:
+        """Cheap reachability check: retrieves the model record, no tokens billed"""
+        
+        if not self.client:
+            return {
+                "status": "disconnected",
+                "message": "OpenAI client not initialized"
+            }
+        
+        try:
+            await asyncio.to_thread(self.client.models.retrieve, self.settings.OPENAI_MODEL)
+            return {
+                "status": "connected",
+                "message": "OpenAI API reachable",
+                "model": self.settings.OPENAI_MODEL
+            }
+        except Exception as e:
+            return {
+                "status": "error",
+                "message": f"OpenAI API check failed: {str(e)}"
+            }
+
 
 # Global service instance
 try:
@@ -2,6 +2,7 @@
 
 import os
 import asyncio
+import logging
 import aiofiles
 import tempfile
 from pathlib import Path
@@ -62,6 +63,11 @@ except ImportError as e:
     print(f"❌ gTTS not available: {e}")
     GTTS_AVAILABLE = False
 
+logger = logging.getLogger(__name__)
+
+# Public URL prefix for files written to audio_dir
+WEB_URL_PREFIX = "/static/audio/"
+
 class EnhancedTTSService:
     """Enhanced TTS Service with multiple providers and emotional support"""
     
@@ -74,6 +80,9 @@ class EnhancedTTSService:
         self.azure_speech_key = None
         self.azure_speech_region = "southeastasia"
         
+        # Azure SpeechConfig cache - สร้างครั้งเดียวต่อ (region, voice) เพื่อไม่ต้องแลก token ใหม่ทุกครั้ง
+        self._azure_speech_configs: Dict[Tuple[str, str], Any] = {}
+        
         # Provider configurations
         self.providers = {
             "edge": {
@@ -279,7 +288,7 @@ class EnhancedTTSService:
         """ทำความสะอาดและตั้งค่า metadata ใหม่แบบถูกต้อง"""
         try:
             if not AUDIO_PROCESSING_AVAILABLE:
-                print("   ⚠️ Audio processing not available for metadata cleaning")
+                logger.warning("⚠️ Audio processing not available for metadata cleaning")
                 return
             
             # โหลดไฟล์ MP3
@@ -301,10 +310,10 @@ class EnhancedTTSService:
             # บันทึก metadata ใหม่
             audio_file.save()
             
-            print(f"   🏷️ Metadata cleaned and updated")
+            logger.debug("🏷️ Metadata cleaned and updated")
             
         except Exception as e:
-            print(f"   ⚠️ Metadata cleaning failed: {e}")
+            logger.warning("⚠️ Metadata cleaning failed: %s", e)
             # ไม่ throw error เพราะไฟล์ยังใช้งานได้
     
     async def _enhance_audio_quality(self, file_path: Path, script_title: str = "", emotion: str = ""):
@@ -313,7 +322,7 @@ class EnhancedTTSService:
             if not AUDIO_PROCESSING_AVAILABLE:
                 return
                 
-            print(f"   🎧 Enhancing audio quality...")
+            logger.debug("🎧 Enhancing audio quality...")
             
             # โหลดและปรับปรุงเสียง
             audio = AudioSegment.from_file(file_path)
@@ -346,10 +355,10 @@ class EnhancedTTSService:
             # ทำความสะอาด metadata
             self._clean_metadata(file_path, script_title, emotion)
             
-            print(f"   ✅ Audio quality enhanced and metadata cleaned")
+            logger.debug("✅ Audio quality enhanced and metadata cleaned")
             
         except Exception as e:
-            print(f"   ⚠️ Audio enhancement failed: {e}")
+            logger.warning("⚠️ Audio enhancement failed: %s", e)
             # ลองทำความสะอาด metadata อย่างเดียว
             try:
                 self._clean_metadata(file_path, script_title, emotion)
@@ -379,10 +388,10 @@ class EnhancedTTSService:
             else:
                 unique_id = script_id
             
-            print(f"🎵 Generating speech with provider: {provider}")
-            print(f"   📝 Text: {text[:50]}...")
-            print(f"   🎭 Emotion: {emotion}")
-            print(f"   🆔 Unique ID: {unique_id}")
+            logger.debug("🎵 Generating speech with provider: %s", provider)
+            logger.debug("📝 Text: %s...", text[:50])
+            logger.debug("🎭 Emotion: %s", emotion)
+            logger.debug("🆔 Unique ID: %s", unique_id)
             
             # เลือก provider ตามที่ระบุ
             if provider == "basic" or provider == "gtts":
@@ -394,17 +403,17 @@ class EnhancedTTSService:
             elif provider == "azure":
                 return await self._generate_azure_speech(text, unique_id, voice_config or {}, emotion, intensity, script_title)
             else:
-                print(f"   ⚠️ Unknown provider '{provider}', falling back to basic")
+                logger.warning("⚠️ Unknown provider '%s', falling back to basic", provider)
                 return await self._generate_basic_speech(text, unique_id, language, script_title)
                 
         except Exception as e:
-            print(f"❌ Error generating speech with {provider}: {e}")
+            logger.error("❌ Error generating speech with %s: %s", provider, e)
             # Fallback to basic TTS
             try:
-                print(f"   🔄 Falling back to basic TTS")
+                logger.debug("🔄 Falling back to basic TTS")
                 return await self._generate_basic_speech(text, unique_id, language, script_title)
             except Exception as fallback_error:
-                print(f"❌ Even basic TTS failed: {fallback_error}")
+                logger.error("❌ Even basic TTS failed: %s", fallback_error)
                 return "", ""
     
     async def _generate_edge_speech(
@@ -433,43 +442,55 @@ class EnhancedTTSService:
             filename = f"script_{script_id}_{text_hash}_{timestamp}.mp3"
             
             file_path = self.audio_dir / filename
-            web_url = f"/static/audio/{filename}"
+            web_url = WEB_URL_PREFIX + filename
             
-            print(f"   📝 Using plain text (no SSML) to prevent concatenation")
-            print(f"   🧹 Text: '{cleaned_text}'")
-            print(f"   📁 Unique filename: {filename}")
-            
-            # ลบไฟล์เก่าหากมี (ใช้ pattern เดิม)
-            old_pattern = f"script_{script_id}_{text_hash}_*.mp3"
-            import glob
-            for old_file in glob.glob(str(self.audio_dir / old_pattern)):
-                try:
-                    Path(old_file).unlink()
-                    print(f"   🗑️ Removed old file: {Path(old_file).name}")
-                except:
-                    pass
+            logger.debug("📝 Using plain text (no SSML) to prevent concatenation")
+            logger.debug("🧹 Text: '%s'", cleaned_text)
+            logger.debug("📁 Unique filename: %s", filename)
             
             # สร้าง TTS ด้วย Edge TTS โดยไม่ใช้ SSML
             communicate = edge_tts.Communicate(cleaned_text, voice_name)
             
             # สร้างไฟล์ชั่วคราวก่อน
             temp_path = file_path.with_suffix('.tmp.mp3')
-            await communicate.save(str(temp_path))
             
-            print(f"   🎵 Edge TTS raw file generated: {temp_path.name}")
+            # ลบไฟล์เก่า (pattern เดิม) ใน thread แยก ขนานกับการสร้างและแก้ไขไฟล์ใหม่
+            old_pattern = f"script_{script_id}_{text_hash}_*.mp3"
+            # (ไม่ใช้ TaskGroup: จะห่อ error จริงของ edge-tts ไว้ใน ExceptionGroup)
+            cleanup = asyncio.create_task(asyncio.to_thread(
+                self._remove_old_audio_files, old_pattern, (file_path.name, temp_path.name)
+            ))
+            try:
+                await communicate.save(str(temp_path))
+                logger.debug("🎵 Edge TTS raw file generated: %s", temp_path.name)
+                
+                # แก้ไขปัญหา LAME Padding และ Contamination
+                fixed = await self._fix_lame_padding_and_contamination(temp_path, file_path, script_title, emotion)
+            finally:
+                await cleanup
             
-            # แก้ไขปัญหา LAME Padding และ Contamination
-            if await self._fix_lame_padding_and_contamination(temp_path, file_path, script_title, emotion):
-                print(f"   ✅ Edge TTS generation completed (LAME padding fixed)")
+            if fixed:
+                logger.debug("✅ Edge TTS generation completed (LAME padding fixed)")
                 return str(file_path), web_url
             else:
-                print(f"   ❌ LAME padding fix failed")
+                logger.error("❌ LAME padding fix failed")
                 raise Exception("LAME padding fix failed")
                 
         except Exception as e:
-            print(f"   ❌ Edge TTS failed: {e}")
+            logger.error("❌ Edge TTS failed: %s", e)
             raise
     
+    def _remove_old_audio_files(self, pattern: str, keep: Tuple[str, ...]):
+        """ลบไฟล์เสียงเก่าที่ตรงกับ pattern ยกเว้นไฟล์ที่กำลังสร้างอยู่"""
+        for old_file in self.audio_dir.glob(pattern):
+            if old_file.name in keep:
+                continue
+            try:
+                old_file.unlink()
+                logger.debug("🗑️ Removed old file: %s", old_file.name)
+            except OSError:
+                pass
+    
     async def _fix_lame_padding_and_contamination(self, temp_path: Path, final_path: Path, script_title: str, emotion: str) -> bool:
         """แก้ไขปัญหา LAME Encoder Padding และ Audio Contamination"""
         
@@ -479,20 +500,20 @@ class EnhancedTTSService:
                 temp_path.rename(final_path)
                 return True
             
-            print(f"   🔧 Fixing LAME padding and contamination...")
+            logger.debug("🔧 Fixing LAME padding and contamination...")
             
             # โหลดไฟล์เสียง
             audio = AudioSegment.from_file(temp_path)
             original_duration = len(audio) / 1000
             
-            print(f"   ⏱️ Original duration: {original_duration:.1f}s")
+            logger.debug("⏱️ Original duration: %.1fs", original_duration)
             
             # แก้ไขปัญหา LAME padding และ contamination
             fixed_audio = self._remove_lame_padding_and_silence(audio)
             
             if fixed_audio:
                 final_duration = len(fixed_audio) / 1000
-                print(f"   ✂️ Fixed duration: {final_duration:.1f}s (removed {original_duration - final_duration:.1f}s)")
+                logger.debug("✂️ Fixed duration: %.1fs (removed %.1fs)", final_duration, original_duration - final_duration)
                 
                 # Normalize และปรับปรุงคุณภาพ
                 fixed_audio = normalize(fixed_audio)
@@ -516,16 +537,16 @@ class EnhancedTTSService:
                 if temp_path.exists():
                     temp_path.unlink()
                 
-                print(f"   🎯 LAME padding and contamination removed successfully")
+                logger.debug("🎯 LAME padding and contamination removed successfully")
                 return True
             else:
-                print(f"   ❌ Could not fix LAME padding")
+                logger.error("❌ Could not fix LAME padding")
                 # ใช้ไฟล์เดิม
                 temp_path.rename(final_path)
                 return True
                 
         except Exception as e:
-            print(f"   ❌ LAME padding fix failed: {e}")
+            logger.error("❌ LAME padding fix failed: %s", e)
             
             # หากล้มเหลว ให้ย้ายไฟล์เดิม
             try:
@@ -539,7 +560,7 @@ class EnhancedTTSService:
         """กำจัด LAME padding และเสียงเงียบที่ไม่ต้องการ"""
         
         try:
-            print(f"   🔍 Analyzing audio for padding and silence...")
+            logger.debug("🔍 Analyzing audio for padding and silence...")
             
             # Parameters สำหรับการตรวจจับเสียง
             silence_threshold = -50  # dB
@@ -561,7 +582,7 @@ class EnhancedTTSService:
                 
                 if volume > silence_threshold:
                     start_pos = max(0, i - chunk_size)  # เก็บ buffer เล็กน้อย
-                    print(f"   🎯 Found audio start at: {start_pos/1000:.1f}s")
+                    logger.debug("🎯 Found audio start at: %.1fs", start_pos/1000)
                     break
             
             # หาจุดสิ้นสุดของเสียงจริง (ข้ามเสียงเงียบท้าย)
@@ -577,20 +598,20 @@ class EnhancedTTSService:
                 
                 if volume > silence_threshold:
                     end_pos = min(len(audio), i + chunk_size * 2)  # เก็บ buffer เล็กน้อย
-                    print(f"   🎯 Found audio end at: {end_pos/1000:.1f}s")
+                    logger.debug("🎯 Found audio end at: %.1fs", end_pos/1000)
                     break
             
             # ตรวจสอบว่าเสียงที่เหลือมีความยาวสมเหตุสมผล
             trimmed_duration = (end_pos - start_pos) / 1000
             
             if trimmed_duration < 0.5:
-                print(f"   ⚠️ Trimmed audio too short ({trimmed_duration:.1f}s), using minimal trim")
+                logger.warning("⚠️ Trimmed audio too short (%.1fs), using minimal trim", trimmed_duration)
                 # ใช้การตัดแบบน้อยที่สุด
                 start_pos = min(start_pos, len(audio) * 0.1)  # ตัดไม่เกิน 10% ต้น
                 end_pos = max(end_pos, len(audio) * 0.9)      # ตัดไม่เกิน 10% ท้าย
             
             elif trimmed_duration > 30:
-                print(f"   ⚠️ Trimmed audio still too long ({trimmed_duration:.1f}s), applying aggressive trim")
+                logger.warning("⚠️ Trimmed audio still too long (%.1fs), applying aggressive trim", trimmed_duration)
                 # หาช่วงที่มีเสียงดังที่สุด
                 max_volume = -100
                 best_start = 0
@@ -612,19 +633,19 @@ class EnhancedTTSService:
                 
                 start_pos = best_start
                 end_pos = best_end
-                print(f"   ✂️ Using aggressive trim: {start_pos/1000:.1f}s to {end_pos/1000:.1f}s")
+                logger.debug("✂️ Using aggressive trim: %.1fs to %.1fs", start_pos/1000, end_pos/1000)
             
             # ตัดเสียง
             if start_pos > 0 or end_pos < len(audio):
                 trimmed_audio = audio[start_pos:end_pos]
-                print(f"   ✅ Trimmed from {len(audio)/1000:.1f}s to {len(trimmed_audio)/1000:.1f}s")
+                logger.debug("✅ Trimmed from %.1fs to %.1fs", len(audio)/1000, len(trimmed_audio)/1000)
                 return trimmed_audio
             else:
-                print(f"   ℹ️ No trimming needed")
+                logger.debug("ℹ️ No trimming needed")
                 return audio
                 
         except Exception as e:
-            print(f"   ❌ Padding removal failed: {e}")
+            logger.error("❌ Padding removal failed: %s", e)
             return audio
 
     def _clean_text_for_tts(self, text: str) -> str:
@@ -699,18 +720,18 @@ class EnhancedTTSService:
                 temp_path.rename(final_path)
                 return True
             
-            print(f"   🔍 Validating and cleaning audio...")
+            logger.debug("🔍 Validating and cleaning audio...")
             
             # โหลดไฟล์เสียง
             audio = AudioSegment.from_file(temp_path)
             
             # ตรวจสอบความยาวไฟล์
             duration_ms = len(audio)
-            print(f"   ⏱️ Original duration: {duration_ms/1000:.1f}s")
+            logger.debug("⏱️ Original duration: %.1fs", duration_ms/1000)
             
             # หากไฟล์ยาวเกินไป (มากกว่า 30 วินาที) อาจมีปัญหา contamination
             if duration_ms > 30000:  # 30 seconds
-                print(f"   ⚠️ Audio too long ({duration_ms/1000:.1f}s), attempting to extract main content...")
+                logger.warning("⚠️ Audio too long (%.1fs), attempting to extract main content...", duration_ms/1000)
                 
                 # หาส่วนที่เป็นเสียงจริง (ไม่ใช่เงียบ)
                 # แบ่งเป็นช่วงๆ และวิเคราะห์ volume
@@ -737,7 +758,7 @@ class EnhancedTTSService:
                     end_time = min(len(audio), end_time + 500)  # 0.5s buffer
                     
                     audio = audio[start_time:end_time]
-                    print(f"   ✂️ Trimmed to: {len(audio)/1000:.1f}s (removed contamination)")
+                    logger.debug("✂️ Trimmed to: %.1fs (removed contamination)", len(audio)/1000)
             
             # Normalize และปรับปรุงคุณภาพ
             audio = normalize(audio)
@@ -760,11 +781,11 @@ class EnhancedTTSService:
             # ทำความสะอาด metadata
             self._clean_metadata(final_path, script_title, emotion)
             
-            print(f"   ✅ Audio validated and cleaned: {len(audio)/1000:.1f}s")
+            logger.debug("✅ Audio validated and cleaned: %.1fs", len(audio)/1000)
             return True
             
         except Exception as e:
-            print(f"   ❌ Audio validation failed: {e}")
+            logger.error("❌ Audio validation failed: %s", e)
             
             # หากล้มเหลว ให้ย้ายไฟล์เดิม
             try:
@@ -794,10 +815,10 @@ class EnhancedTTSService:
             
             filename = f"script_{script_id}_{hashlib.md5(text.encode()).hexdigest()[:8]}.mp3"
             file_path = self.audio_dir / filename
-            web_url = f"/static/audio/{filename}"
+            web_url = WEB_URL_PREFIX + filename
             
-            print(f"   🤖 Using ElevenLabs voice: {voice_id}")
-            print(f"   📁 Output: {file_path}")
+            logger.debug("🤖 Using ElevenLabs voice: %s", voice_id)
+            logger.debug("📁 Output: %s", file_path)
             
             # สร้าง audio
             audio = generate(
@@ -813,11 +834,11 @@ class EnhancedTTSService:
             # ปรับปรุงคุณภาพเสียงและทำความสะอาด metadata
             await self._enhance_audio_quality(file_path, script_title, emotion)
             
-            print(f"   ✅ ElevenLabs generation completed")
+            logger.debug("✅ ElevenLabs generation completed")
             return str(file_path), web_url
             
         except Exception as e:
-            print(f"   ❌ ElevenLabs failed: {e}")
+            logger.error("❌ ElevenLabs failed: %s", e)
             raise
     
     async def _generate_azure_speech(
@@ -832,18 +853,12 @@ class EnhancedTTSService:
         """สร้างเสียงด้วย Azure Cognitive Services"""
         
         try:
-            # สร้าง Azure Speech config
-            speech_config = speechsdk.SpeechConfig(
-                subscription=self.azure_speech_key, 
-                region=self.azure_speech_region
-            )
-            
             voice_name = voice_config.get("voice", "th-TH-PremwadeeNeural")
-            speech_config.speech_synthesis_voice_name = voice_name
+            speech_config = self._get_azure_speech_config(voice_name)
             
-            filename = f"script_{script_id}_{hashlib.md5(text.encode()).hexdigest()[:8]}.wav"
+            filename = f"script_{script_id}_{hashlib.md5(text.encode()).hexdigest()[:8]}.mp3"
             file_path = self.audio_dir / filename
-            web_url = f"/static/audio/{filename}"
+            web_url = WEB_URL_PREFIX + filename
             
             # สร้าง SSML พร้อมอารมณ์
             ssml_text = self._create_emotional_ssml(text, voice_name, emotion, intensity)
@@ -859,17 +874,34 @@ class EnhancedTTSService:
             result = synthesizer.speak_ssml_async(ssml_text).get()
             
             if result.reason == speechsdk.ResultReason.SynthesizingAudioCompleted:
-                # แปลงเป็น MP3 และทำความสะอาด metadata
-                mp3_path = await self._convert_to_mp3(file_path, script_title, emotion)
-                print(f"   ✅ Azure Speech generation completed")
-                return str(mp3_path), web_url.replace('.wav', '.mp3')
+                # ไฟล์เป็น MP3 อยู่แล้ว ทำความสะอาด metadata อย่างเดียว
+                self._clean_metadata(file_path, script_title, emotion)
+                logger.debug("✅ Azure Speech generation completed")
+                return str(file_path), web_url
             else:
                 raise Exception(f"Azure synthesis failed: {result.reason}")
                 
         except Exception as e:
-            print(f"   ❌ Azure Speech failed: {e}")
+            logger.error("❌ Azure Speech failed: %s", e)
             raise
     
+    def _get_azure_speech_config(self, voice_name: str) -> 'speechsdk.SpeechConfig':
+        """ดึง Azure SpeechConfig จาก cache หรือสร้างใหม่ครั้งแรก"""
+        key = (self.azure_speech_region, voice_name)
+        speech_config = self._azure_speech_configs.get(key)
+        if speech_config is None:
+            speech_config = speechsdk.SpeechConfig(
+                subscription=self.azure_speech_key, 
+                region=self.azure_speech_region
+            )
+            speech_config.speech_synthesis_voice_name = voice_name
+            # ขอ MP3 จาก Azure โดยตรง ไม่ต้องแปลง WAV -> MP3 เอง
+            speech_config.set_speech_synthesis_output_format(
+                speechsdk.SpeechSynthesisOutputFormat.Audio48Khz192KBitRateMonoMp3
+            )
+            self._azure_speech_configs[key] = speech_config
+        return speech_config
+    
     def _create_emotional_ssml(self, text: str, voice_name: str, emotion: str, intensity: float) -> str:
         """สร้าง SSML ที่รองรับอารมณ์"""
         
@@ -947,36 +979,6 @@ class EnhancedTTSService:
         prefix = emotion_prefixes.get(emotion, "")
         return f"{prefix}{text}" if prefix else text
     
-    async def _convert_to_mp3(self, wav_path: Path, script_title: str = "", emotion: str = "") -> Path:
-        """แปลงไฟล์ WAV เป็น MP3 พร้อมทำความสะอาด metadata"""
-        try:
-            if not AUDIO_PROCESSING_AVAILABLE:
-                return wav_path
-                
-            mp3_path = wav_path.with_suffix('.mp3')
-            audio = AudioSegment.from_wav(wav_path)
-            
-            # Export เป็น MP3 ด้วยการตั้งค่าที่ดี
-            audio.export(
-                mp3_path, 
-                format="mp3", 
-                bitrate="128k",
-                parameters=["-q:a", "2"]
-            )
-            
-            # ลบไฟล์ WAV
-            if wav_path.exists():
-                wav_path.unlink()
-            
-            # ทำความสะอาด metadata
-            self._clean_metadata(mp3_path, script_title, emotion)
-                
-            return mp3_path
-            
-        except Exception as e:
-            print(f"   ⚠️ MP3 conversion failed: {e}")
-            return wav_path
-    
     def _get_best_available_provider(self) -> str:
         """เลือก provider ที่ดีที่สุดที่มีอยู่"""
         try:
@@ -986,22 +988,22 @@ class EnhancedTTSService:
             for provider in priority_order:
                 if (provider in self.providers and 
                     self.providers[provider].get("available", False)):
-                    print(f"   🎯 Selected provider: {provider}")
+                    logger.debug("🎯 Selected provider: %s", provider)
                     return provider
             
             # หาก providers ไม่มีเลย ให้ใช้ basic
-            print("   ⚠️ No enhanced providers available, using basic fallback")
+            logger.warning("⚠️ No enhanced providers available, using basic fallback")
             return "basic"
             
         except Exception as e:
-            print(f"   ❌ Error selecting provider: {e}")
+            logger.error("❌ Error selecting provider: %s", e)
             return "basic"
     
     async def _generate_basic_speech(self, text: str, script_id: str, language: str = "th", script_title: str = "") -> Tuple[str, str]:
         """Fallback เป็น basic gTTS พร้อม unique filename"""
         try:
             if not GTTS_AVAILABLE:
-                print("   ❌ gTTS not available for fallback")
+                logger.error("❌ gTTS not available for fallback")
                 return "", ""
             
             import time
@@ -1015,11 +1017,11 @@ class EnhancedTTSService:
             filename = f"script_{script_id}_{text_hash}_{timestamp}.mp3"
             
             file_path = self.audio_dir / filename
-            web_url = f"/static/audio/{filename}"
+            web_url = WEB_URL_PREFIX + filename
             
-            print(f"   📢 Using basic gTTS")
-            print(f"   📁 Unique filename: {filename}")
-            print(f"   🧹 Text: '{cleaned_text[:30]}...'")
+            logger.debug("📢 Using basic gTTS")
+            logger.debug("📁 Unique filename: %s", filename)
+            logger.debug("🧹 Text: '%s...'", cleaned_text[:30])
             
             # สร้างด้วย gTTS
             tts = gTTS(text=cleaned_text, lang=language, slow=False)
@@ -1032,11 +1034,11 @@ class EnhancedTTSService:
                 except:
                     pass
             
-            print(f"   ✅ Basic gTTS generation completed")
+            logger.debug("✅ Basic gTTS generation completed")
             return str(file_path), web_url
             
         except Exception as e:
-            print(f"   ❌ Basic TTS failed: {e}")
+            logger.error("❌ Basic TTS failed: %s", e)
             return "", ""
     
     def is_enhanced_available(self) -> bool:
@@ -1079,7 +1081,7 @@ class EnhancedTTSService:
         """Generate audio for script - compatible with existing system แก้ไขแล้ว"""
         
         try:
-            print(f"🎵 Generating audio for script {script_id}")
+            logger.debug("🎵 Generating audio for script %s", script_id)
             
             # Parse voice persona config safely
             script_title = f"Script {script_id}"  # Default title
@@ -1099,14 +1101,14 @@ class EnhancedTTSService:
                 voice_config = {"voice": "th-TH-PremwadeeNeural"}
                 intensity = 1.0
             
-            print(f"   🎭 Using provider: {provider}")
-            print(f"   🗣️ Voice config: {voice_config}")
-            print(f"   🎭 Emotion: {emotion}")
-            print(f"   🏷️ Title: {script_title}")
+            logger.debug("🎭 Using provider: %s", provider)
+            logger.debug("🗣️ Voice config: %s", voice_config)
+            logger.debug("🎭 Emotion: %s", emotion)
+            logger.debug("🏷️ Title: %s", script_title)
             
             # ตรวจสอบว่า provider พร้อมใช้งาน
             if not self.providers.get(provider, {}).get("available", False):
-                print(f"   ⚠️ Provider {provider} not available, switching to best available")
+                logger.warning("⚠️ Provider %s not available, switching to best available", provider)
                 provider = self._get_best_available_provider()
             
             # ใช้ enhanced generation หากมี
@@ -1123,16 +1125,16 @@ class EnhancedTTSService:
                 )
             else:
                 # ใช้ basic fallback
-                print(f"   📢 Using basic fallback for {provider}")
+                logger.debug("📢 Using basic fallback for %s", provider)
                 return await self._generate_basic_speech(content, script_id, language, script_title)
                 
         except Exception as e:
-            print(f"❌ Error in generate_script_audio: {e}")
+            logger.error("❌ Error in generate_script_audio: %s", e)
             # Ultimate fallback
             try:
                 return await self._generate_basic_speech(content, script_id, language, "Script Audio")
             except Exception as fallback_error:
-                print(f"❌ Even fallback failed: {fallback_error}")
+                logger.error("❌ Even fallback failed: %s", fallback_error)
                 return "", ""
     
     def get_available_providers(self) -> Dict[str, Any]:
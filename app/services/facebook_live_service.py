@@ -7,12 +7,32 @@ import os
 import requests
 import secrets
 import logging
+from collections import deque
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 import asyncio
 
 logger = logging.getLogger(__name__)
 
+# Mock-mode comment pool: (message, user id, display name)
+_MOCK_COMMENTS = (
+    ("สินค้าดีมาก ราคาเท่าไหร่ครับ?", "user_001", "ลูกค้า A"),
+    ("มีส่วนลดไหมคะ?", "user_002", "ลูกค้า B"),
+    ("สนใจสินค้านี้มากเลย", "user_003", "ลูกค้า C"),
+    ("จัดส่งทั่วไทยไหมครับ?", "user_004", "ลูกค้า D"),
+)
+
+# Mock ids are handed out from a batch filled by a single urandom read
+_MOCK_ID_BATCH = 1024
+_mock_id_pool = deque()
+
+def _mock_token() -> str:
+    """16 hex chars, same shape as secrets.token_hex(8)"""
+    if not _mock_id_pool:
+        blob = secrets.token_hex(8 * _MOCK_ID_BATCH)
+        _mock_id_pool.extend(blob[i:i + 16] for i in range(0, len(blob), 16))
+    return _mock_id_pool.popleft()
+
 class FacebookLiveService:
     def __init__(self):
         # Load configuration from environment
@@ -385,7 +405,7 @@ class FacebookLiveService:
     async def _mock_create_live_video(self, title: str, description: str) -> Dict[str, Any]:
         """Mock live video creation"""
         try:
-            live_id = f"mock_live_{secrets.token_hex(8)}"
+            live_id = f"mock_live_{_mock_token()}"
             
             live_video_data = {
                 "id": live_id,
@@ -529,37 +549,18 @@ class FacebookLiveService:
         
         # 30% chance of returning new comments
         if random.random() > 0.7:
-            mock_comments = [
+            # Return 1-2 random comments; only the picked ones are built, sharing one timestamp
+            now = datetime.now().isoformat()
+            selected_comments = [
                 {
-                    "id": f"mock_comment_{secrets.token_hex(8)}",
-                    "message": "สินค้าดีมาก ราคาเท่าไหร่ครับ?",
-                    "from": {"id": "user_001", "name": "ลูกค้า A"},
-                    "created_time": datetime.now().isoformat()
-                },
-                {
-                    "id": f"mock_comment_{secrets.token_hex(8)}",
-                    "message": "มีส่วนลดไหมคะ?",
-                    "from": {"id": "user_002", "name": "ลูกค้า B"},
-                    "created_time": datetime.now().isoformat()
-                },
-                {
-                    "id": f"mock_comment_{secrets.token_hex(8)}",
-                    "message": "สนใจสินค้านี้มากเลย",
-                    "from": {"id": "user_003", "name": "ลูกค้า C"},
-                    "created_time": datetime.now().isoformat()
-                },
-                {
-                    "id": f"mock_comment_{secrets.token_hex(8)}",
-                    "message": "จัดส่งทั่วไทยไหมครับ?",
-                    "from": {"id": "user_004", "name": "ลูกค้า D"},
-                    "created_time": datetime.now().isoformat()
+                    "id": f"mock_comment_{_mock_token()}",
+                    "message": message,
+                    "from": {"id": user_id, "name": name},
+                    "created_time": now
                 }
+                for message, user_id, name in random.sample(_MOCK_COMMENTS, random.randint(1, 2))
             ]
             
-            # Return 1-2 random comments
-            num_comments = random.randint(1, 2)
-            selected_comments = random.sample(mock_comments, num_comments)
-            
             return {
                 "success": True,
                 "comments": selected_comments,
@@ -577,7 +578,7 @@ class FacebookLiveService:
             if self.mock_mode:
                 return {
                     "success": True,
-                    "comment_id": f"mock_comment_{secrets.token_hex(8)}",
+                    "comment_id": f"mock_comment_{_mock_token()}",
                     "message": "Comment posted successfully (Mock Mode)",
                     "mock_mode": True
                 }
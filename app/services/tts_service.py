@@ -5,6 +5,7 @@ Text-to-Speech service using Google TTS
 
 import os
 import asyncio
+import logging
 from pathlib import Path
 from typing import Optional
 from gtts import gTTS
@@ -12,6 +13,11 @@ import hashlib
 import tempfile
 import aiofiles
 
+logger = logging.getLogger(__name__)
+
+# Public URL prefix for files written to audio_dir
+WEB_URL_PREFIX = "/static/audio/"
+
 class TTSService:
     """Text-to-Speech service"""
     
@@ -20,22 +26,8 @@ class TTSService:
         self.audio_dir.mkdir(parents=True, exist_ok=True)
         
         # Supported languages
-        self.languages = {
-            'th': 'Thai',
-            'en': 'English',
-            'ja': 'Japanese',
-            'ko': 'Korean',
-            'zh': 'Chinese'
-        }
+        self.languages = frozenset(('th', 'en', 'ja', 'ko', 'zh'))
         
-    def _get_audio_path(self, script_id: str) -> Path:
-        """Get audio file path for script"""
-        return self.audio_dir / f"{script_id}.mp3"
-    
-    def _get_audio_url(self, script_id: str) -> str:
-        """Get audio file URL for web access"""
-        return f"/static/audio/{script_id}.mp3"
-    
     async def generate_speech(
         self, 
         text: str, 
@@ -59,8 +51,8 @@ class TTSService:
         if language not in self.languages:
             language = 'th'  # Default to Thai
             
-        audio_path = self._get_audio_path(script_id)
-        audio_url = self._get_audio_url(script_id)
+        audio_path = self.audio_dir / f"{script_id}.mp3"
+        audio_url = WEB_URL_PREFIX + script_id + ".mp3"
         
         # Check if file already exists
         if audio_path.exists():
@@ -84,11 +76,11 @@ class TTSService:
             # Move to final location
             os.rename(temp_path, audio_path)
             
-            print(f"✅ Generated TTS audio: {audio_path}")
+            logger.debug("✅ Generated TTS audio: %s", audio_path)
             return str(audio_path), audio_url
             
         except Exception as e:
-            print(f"❌ TTS generation failed: {e}")
+            logger.error("❌ TTS generation failed: %s", e)
             # Return empty if failed
             return "", ""
     
@@ -107,22 +99,21 @@ class TTSService:
     
     def get_script_audio_url(self, script_id: str) -> Optional[str]:
         """Get audio URL if file exists"""
-        audio_path = self._get_audio_path(script_id)
-        if audio_path.exists():
-            return self._get_audio_url(script_id)
+        if (self.audio_dir / f"{script_id}.mp3").exists():
+            return WEB_URL_PREFIX + script_id + ".mp3"
         return None
     
     def delete_script_audio(self, script_id: str) -> bool:
         """Delete audio file for script"""
-        audio_path = self._get_audio_path(script_id)
+        audio_path = self.audio_dir / f"{script_id}.mp3"
         try:
             if audio_path.exists():
                 audio_path.unlink()
-                print(f"🗑️ Deleted audio: {audio_path}")
+                logger.debug("🗑️ Deleted audio: %s", audio_path)
                 return True
             return False
         except Exception as e:
-            print(f"❌ Failed to delete audio: {e}")
+            logger.error("❌ Failed to delete audio: %s", e)
             return False
     
     async def cleanup_unused_audio(self, existing_script_ids: list[str]):
@@ -138,12 +129,12 @@ class TTSService:
                 try:
                     audio_file.unlink()
                     deleted_count += 1
-                    print(f"🧹 Cleaned up unused audio: {audio_file}")
+                    logger.debug("🧹 Cleaned up unused audio: %s", audio_file)
                 except Exception as e:
-                    print(f"❌ Failed to cleanup {audio_file}: {e}")
+                    logger.error("❌ Failed to cleanup %s: %s", audio_file, e)
         
         if deleted_count > 0:
-            print(f"🧹 Cleaned up {deleted_count} unused audio files")
+            logger.debug("🧹 Cleaned up %s unused audio files", deleted_count)
     
     def get_audio_stats(self) -> dict:
         """Get audio files statistics"""
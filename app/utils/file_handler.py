@@ -5,20 +5,89 @@ Handles file uploads, validation, and management for images, videos, and audio
 """
 
 import os
+import re
+import mmap
+import time
+import asyncio
 import hashlib
-import uuid
+import secrets
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, Dict, Any, List, Tuple
 import aiofiles
 from fastapi import UploadFile, HTTPException
+from fastapi.responses import FileResponse
 import mimetypes
 from PIL import Image
 import json
 from datetime import datetime
 
+# Optional SIMD resizer (Pillow-compatible API), falls back to PIL
+try:
+    import pic_scale
+    PIC_SCALE_AVAILABLE = True
+except ImportError:
+    PIC_SCALE_AVAILABLE = False
+
+# Upload content hash: pinned to BLAKE2b-128 (32 hex chars) so the same bytes
+# hash identically on every install and can be compared for dedup
+def _content_hasher():
+    return hashlib.blake2b(digest_size=16)
+
+# Reject decompression bombs before decode: PIL raises DecompressionBombError
+# above 2x this limit, i.e. anything over 50 megapixels
+Image.MAX_IMAGE_PIXELS = 25_000_000
+
+# Worker pool for image processing so resize/encode runs off the request coroutine
+_processing_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="file-processing")
+
+# Finished background jobs kept for get_upload_status; oldest dropped first
+_MAX_FINISHED_JOBS = 256
+
+# Characters kept in cleaned upload names: word chars (incl. Thai), space, hyphen
+_FILENAME_CLEAN_RE = re.compile(r'[^\w \-]')
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+# SOFn markers carry the frame size; C4 (DHT), C8 (JPG) and CC (DAC) do not
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+def _fast_image_size(file_path: Path) -> Optional[Tuple[int, int, str]]:
+    """Read JPEG/PNG dimensions straight from the mmap'd header, None if unsupported"""
+    with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        size = len(m)
+        
+        if m[:8] == _PNG_SIGNATURE and m[12:16] == b"IHDR":
+            width = int.from_bytes(m[16:20], 'big')
+            height = int.from_bytes(m[20:24], 'big')
+            return width, height, 'PNG'
+        
+        if m[:2] == b"\xff\xd8":
+            i = 2
+            while i + 9 <= size:
+                if m[i] != 0xFF:
+                    return None
+                marker = m[i + 1]
+                if marker == 0xFF:  # fill byte
+                    i += 1
+                    continue
+                if marker in _JPEG_SOF_MARKERS:
+                    height = int.from_bytes(m[i + 5:i + 7], 'big')
+                    width = int.from_bytes(m[i + 7:i + 9], 'big')
+                    return width, height, 'JPEG'
+                i += 2 + int.from_bytes(m[i + 2:i + 4], 'big')
+        
+        return None
+
+
 class FileHandler:
     """Comprehensive file handling utility"""
     
+    # Upload directories are created once per process, not per instance
+    _dirs_initialized = False
+    
     def __init__(self):
         # Base directories
         self.upload_dir = Path("frontend/uploads")
@@ -33,25 +102,49 @@ class FileHandler:
         # Create directories
         self._ensure_directories()
         
+        # Resolved once - allowed roots for validate_file_access
+        self._resolved_allowed_dirs = tuple(
+            str(directory.resolve()) for directory in (self.upload_dir, self.static_dir)
+        )
+        
         # File size limits (in bytes)
         self.max_image_size = 10 * 1024 * 1024  # 10MB
         self.max_video_size = 100 * 1024 * 1024  # 100MB
         self.max_audio_size = 10 * 1024 * 1024   # 10MB
         
+        # Upload read/write chunk size - 1MB keeps write() syscalls low for large videos
+        self.upload_chunk_size = 1024 * 1024
+        
         # Allowed file extensions
-        self.allowed_image_exts = {'.jpg', '.jpeg', '.png', '.gif', '.webp'}
-        self.allowed_video_exts = {'.mp4', '.avi', '.mov', '.wmv', '.flv', '.webm'}
-        self.allowed_audio_exts = {'.mp3', '.wav', '.ogg', '.m4a'}
+        self.allowed_image_exts = frozenset({'.jpg', '.jpeg', '.png', '.gif', '.webp'})
+        self.allowed_video_exts = frozenset({'.mp4', '.avi', '.mov', '.wmv', '.flv', '.webm'})
+        self.allowed_audio_exts = frozenset({'.mp3', '.wav', '.ogg', '.m4a'})
+        
+        # Background image processing jobs, keyed by filename; a job moves to
+        # finished (bounded) as soon as it completes
+        self.pending: Dict[str, Future] = {}
+        self.finished: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._jobs_lock = threading.Lock()
         
         # MIME type mapping
         self.mime_types = {
-            'image': ['image/jpeg', 'image/png', 'image/gif', 'image/webp'],
-            'video': ['video/mp4', 'video/avi', 'video/quicktime', 'video/x-msvideo', 'video/webm'],
-            'audio': ['audio/mpeg', 'audio/wav', 'audio/ogg', 'audio/mp4']
+            'image': frozenset({'image/jpeg', 'image/png', 'image/gif', 'image/webp'}),
+            'video': frozenset({'video/mp4', 'video/avi', 'video/quicktime', 'video/x-msvideo', 'video/webm'}),
+            'audio': frozenset({'audio/mpeg', 'audio/wav', 'audio/ogg', 'audio/mp4'})
+        }
+        
+        # Per-type validation rules: (allowed extensions, max size, allowed MIME types)
+        self._type_config = {
+            'image': (self.allowed_image_exts, self.max_image_size, self.mime_types['image']),
+            'video': (self.allowed_video_exts, self.max_video_size, self.mime_types['video']),
+            'audio': (self.allowed_audio_exts, self.max_audio_size, self.mime_types['audio'])
         }
     
     def _ensure_directories(self):
         """Create necessary directories if they don't exist"""
+        if FileHandler._dirs_initialized:
+            return
+        
         directories = [
             self.upload_dir,
             self.image_dir,
@@ -61,20 +154,22 @@ class FileHandler:
         ]
         
         for directory in directories:
-            directory.mkdir(parents=True, exist_ok=True)
+            os.makedirs(directory, exist_ok=True)
+        
+        FileHandler._dirs_initialized = True
     
-    def _generate_filename(self, original_filename: str, file_type: str = "file") -> str:
-        """Generate unique filename with timestamp and UUID"""
+    def _generate_filename(self, original_filename: str, file_type: str = "file", ext: Optional[str] = None) -> str:
+        """Generate unique filename with timestamp and random suffix"""
         # Get file extension
-        ext = Path(original_filename).suffix.lower()
+        if ext is None:
+            ext = Path(original_filename).suffix.lower()
         
         # Generate unique identifier
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        unique_id = str(uuid.uuid4())[:8]
+        timestamp = f"{time.time_ns():016x}"
+        unique_id = secrets.token_hex(4)
         
         # Clean original name (remove extension and special chars)
-        clean_name = Path(original_filename).stem
-        clean_name = "".join(c for c in clean_name if c.isalnum() or c in (' ', '-', '_')).strip()
+        clean_name = _FILENAME_CLEAN_RE.sub('', Path(original_filename).stem).strip()
         clean_name = clean_name.replace(' ', '_')[:30]  # Limit length
         
         # Construct filename
@@ -85,7 +180,7 @@ class FileHandler:
         
         return filename
     
-    def _validate_file(self, file: UploadFile, file_type: str) -> Dict[str, Any]:
+    def _validate_file(self, file: UploadFile, file_type: str, ext: str) -> Dict[str, Any]:
         """Validate uploaded file"""
         validation = {
             "valid": True,
@@ -94,25 +189,12 @@ class FileHandler:
             "file_info": {}
         }
         
-        # Check file extension
-        ext = Path(file.filename).suffix.lower()
-        
-        if file_type == "image":
-            allowed_exts = self.allowed_image_exts
-            max_size = self.max_image_size
-            allowed_mimes = self.mime_types['image']
-        elif file_type == "video":
-            allowed_exts = self.allowed_video_exts
-            max_size = self.max_video_size
-            allowed_mimes = self.mime_types['video']
-        elif file_type == "audio":
-            allowed_exts = self.allowed_audio_exts
-            max_size = self.max_audio_size
-            allowed_mimes = self.mime_types['audio']
-        else:
+        type_config = self._type_config.get(file_type)
+        if type_config is None:
             validation["valid"] = False
             validation["errors"].append(f"Unsupported file type: {file_type}")
             return validation
+        allowed_exts, max_size, allowed_mimes = type_config
         
         # Validate extension
         if ext not in allowed_exts:
@@ -139,54 +221,83 @@ class FileHandler:
         product_id: Optional[int] = None,
         resize: bool = True,
         max_width: int = 1200,
-        max_height: int = 1200
+        max_height: int = 1200,
+        background: bool = False
     ) -> Dict[str, Any]:
-        """Upload and process image file"""
+        """Upload and process image file
+        
+        With background=True the resize/thumbnail step is queued and the
+        result can be polled with get_upload_status(filename).
+        """
         try:
             # Validate file
-            validation = self._validate_file(file, "image")
+            ext = Path(file.filename).suffix.lower()
+            validation = self._validate_file(file, "image", ext)
             if not validation["valid"]:
                 raise HTTPException(status_code=400, detail=validation["errors"])
             
             # Generate filename
-            filename = self._generate_filename(file.filename, "img")
+            filename = self._generate_filename(file.filename, "img", ext)
             file_path = self.image_dir / filename
             
-            # Read file content
-            content = await file.read()
-            
-            # Check file size
-            if len(content) > self.max_image_size:
-                raise HTTPException(
-                    status_code=400, 
-                    detail=f"Image file too large. Maximum size: {self.max_image_size / 1024 / 1024:.1f}MB"
-                )
-            
-            # Save original file
+            # Read and save file in chunks, hashing as we go
+            file_size = 0
+            hasher = _content_hasher()
             async with aiofiles.open(file_path, 'wb') as f:
-                await f.write(content)
+                while chunk := await file.read(self.upload_chunk_size):
+                    file_size += len(chunk)
+                    
+                    # Check size limit during upload
+                    if file_size > self.max_image_size:
+                        # Clean up partial file
+                        await f.close()
+                        file_path.unlink()
+                        raise HTTPException(
+                            status_code=400, 
+                            detail=f"Image file too large. Maximum size: {self.max_image_size / 1024 / 1024:.1f}MB"
+                        )
+                    
+                    hasher.update(chunk)
+                    await f.write(chunk)
             
             # Process image if needed
             processed_info = {}
             if resize:
-                processed_info = await self._process_image(file_path, max_width, max_height)
-            
-            # Get image dimensions
-            try:
-                with Image.open(file_path) as img:
-                    width, height = img.size
-                    format_name = img.format
-            except Exception as e:
-                width, height, format_name = None, None, None
-                print(f"Warning: Could not get image dimensions: {e}")
+                future = _processing_pool.submit(
+                    self._process_image_with_retry, file_path, max_width, max_height
+                )
+                if background:
+                    self.pending[filename] = future
+                    future.add_done_callback(
+                        lambda done, name=filename, path=file_path: self._on_background_done(name, path, done)
+                    )
+                    processed_info = {"status": "queued"}
+                else:
+                    processed_info = await asyncio.wrap_future(future)
+                    if processed_info.get("rejected"):
+                        file_path.unlink()
+                        raise HTTPException(status_code=400, detail="Image dimensions too large")
+            
+            # Get image dimensions - reuse what processing already measured,
+            # unknown until a queued job finishes
+            width, height, format_name = None, None, None
+            if "new_size" in processed_info:
+                width, height = processed_info["new_size"]
+                format_name = processed_info["format"]
+            elif not (resize and background):
+                try:
+                    width, height, format_name = await asyncio.to_thread(self._probe_image_size, file_path)
+                except Exception as e:
+                    print(f"Warning: Could not get image dimensions: {e}")
             
             result = {
                 "success": True,
                 "filename": filename,
                 "file_path": str(file_path),
                 "web_url": f"/uploads/images/{filename}",
-                "file_size": len(content),
-                "file_size_mb": round(len(content) / 1024 / 1024, 2),
+                "file_size": file_size,
+                "file_size_mb": round(file_size / 1024 / 1024, 2),
+                "content_hash": hasher.hexdigest(),
                 "dimensions": {
                     "width": width,
                     "height": height,
@@ -218,7 +329,63 @@ class FileHandler:
             
             raise HTTPException(status_code=500, detail=f"Error uploading image: {str(e)}")
     
-    async def _process_image(
+    def _process_image_with_retry(
+        self, 
+        file_path: Path, 
+        max_width: int, 
+        max_height: int,
+        attempts: int = 3
+    ) -> Dict[str, Any]:
+        """Run _process_image_sync in a worker thread, retrying transient I/O errors with backoff
+
+        Decode failures and rejected images are deterministic and return at once.
+        """
+        for attempt in range(attempts):
+            result = self._process_image_sync(file_path, max_width, max_height)
+            if not result.pop("transient", False):
+                break
+            if attempt < attempts - 1:
+                time.sleep(2 ** attempt)
+        return result
+    
+    def _on_background_done(self, filename: str, file_path: Path, future: Future):
+        """Done-callback for queued jobs: drop rejected uploads, record the outcome"""
+        try:
+            status = {"filename": filename, "status": "completed", "processed": future.result()}
+        except Exception as e:
+            status = {"filename": filename, "status": "failed", "error": str(e)}
+        
+        if status.get("processed", {}).get("rejected"):
+            file_path.unlink(missing_ok=True)
+        
+        with self._jobs_lock:
+            self.pending.pop(filename, None)
+            self.finished[filename] = status
+            while len(self.finished) > _MAX_FINISHED_JOBS:
+                self.finished.popitem(last=False)
+    
+    def get_upload_status(self, filename: str) -> Dict[str, Any]:
+        """Get status of a queued image processing job"""
+        with self._jobs_lock:
+            if filename in self.pending:
+                return {"filename": filename, "status": "processing"}
+            status = self.finished.get(filename)
+        return status or {"filename": filename, "status": "unknown"}
+    
+    def _probe_image_size(self, file_path: Path) -> Tuple[int, int, Optional[str]]:
+        """Read image width, height and format, PIL only for non JPEG/PNG"""
+        try:
+            fast = _fast_image_size(file_path)
+        except (OSError, ValueError):
+            fast = None
+        if fast:
+            return fast
+        
+        with Image.open(file_path) as img:
+            width, height = img.size
+            return width, height, img.format
+    
+    def _process_image_sync(
         self, 
         file_path: Path, 
         max_width: int, 
@@ -228,32 +395,38 @@ class FileHandler:
         try:
             with Image.open(file_path) as img:
                 original_size = img.size
+                format_name = img.format
+                
+                # JPEG: let libjpeg decode straight at 1/2..1/8 scale when the
+                # source is much larger than the target (no-op for other formats)
+                img.draft('RGB', (max_width * 2, max_height * 2))
                 
-                # Convert to RGB if necessary
-                if img.mode in ('RGBA', 'P'):
-                    background = Image.new('RGB', img.size, (255, 255, 255))
-                    if img.mode == 'P':
-                        img = img.convert('RGBA')
-                    background.paste(img, mask=img.split()[-1] if img.mode == 'RGBA' else None)
-                    img = background
+                # Convert to RGB if necessary (flatten alpha onto white)
+                if img.mode == 'P':
+                    img = img.convert('RGBA')
+                if img.mode == 'RGBA':
+                    background = Image.new('RGBA', img.size, (255, 255, 255, 255))
+                    img = Image.alpha_composite(background, img).convert('RGB')
                 
                 # Resize if needed
                 if img.size[0] > max_width or img.size[1] > max_height:
-                    img.thumbnail((max_width, max_height), Image.Resampling.LANCZOS)
+                    img = self._resize_to_fit(img, max_width, max_height)
                     img.save(file_path, 'JPEG', quality=85, optimize=True)
+                    format_name = 'JPEG'
                 
                 # Create thumbnail
                 thumbnail_filename = f"thumb_{file_path.name}"
                 thumbnail_path = self.thumbnail_dir / thumbnail_filename
                 
-                thumb_img = img.copy()
-                thumb_img.thumbnail((300, 300), Image.Resampling.LANCZOS)
+                # Downscale from the already-resized buffer, no intermediate copy
+                thumb_img = self._resize_to_fit(img, 300, 300)
                 thumb_img.save(thumbnail_path, 'JPEG', quality=80)
                 
                 return {
                     "resized": True,
                     "original_size": original_size,
                     "new_size": img.size,
+                    "format": format_name,
                     "thumbnail": {
                         "filename": thumbnail_filename,
                         "path": str(thumbnail_path),
@@ -261,10 +434,31 @@ class FileHandler:
                     }
                 }
                 
+        except Image.DecompressionBombError as e:
+            print(f"Warning: Image rejected: {e}")
+            return {"resized": False, "error": str(e), "rejected": True}
+        except OSError as e:
+            # errno is set for OS-level failures (EIO, EAGAIN, ...); PIL decode
+            # errors are OSErrors without one and won't succeed on retry
+            print(f"Warning: Image processing failed: {e}")
+            return {"resized": False, "error": str(e), "transient": e.errno is not None}
         except Exception as e:
             print(f"Warning: Image processing failed: {e}")
             return {"resized": False, "error": str(e)}
     
+    def _resize_to_fit(self, img: Image.Image, max_width: int, max_height: int) -> Image.Image:
+        """Downscale image to fit within bounds, keeping aspect ratio (LANCZOS)"""
+        width, height = img.size
+        scale = min(max_width / width, max_height / height)
+        if scale >= 1:
+            return img
+        size = (max(1, round(width * scale)), max(1, round(height * scale)))
+        
+        if PIC_SCALE_AVAILABLE:
+            return pic_scale.resize(img, size, Image.Resampling.LANCZOS, workers=0)
+        # reducing_gap: cheap integer box-reduce first, then LANCZOS on the smaller buffer
+        return img.resize(size, Image.Resampling.LANCZOS, reducing_gap=3.0)
+    
     async def upload_video(
         self, 
         file: UploadFile, 
@@ -273,18 +467,20 @@ class FileHandler:
         """Upload video file"""
         try:
             # Validate file
-            validation = self._validate_file(file, "video")
+            ext = Path(file.filename).suffix.lower()
+            validation = self._validate_file(file, "video", ext)
             if not validation["valid"]:
                 raise HTTPException(status_code=400, detail=validation["errors"])
             
             # Generate filename
-            filename = self._generate_filename(file.filename, "video")
+            filename = self._generate_filename(file.filename, "video", ext)
             file_path = self.video_dir / filename
             
-            # Read and save file in chunks to handle large files
+            # Read and save file in chunks to handle large files, hashing as we go
             file_size = 0
+            hasher = _content_hasher()
             async with aiofiles.open(file_path, 'wb') as f:
-                while chunk := await file.read(8192):  # 8KB chunks
+                while chunk := await file.read(self.upload_chunk_size):
                     file_size += len(chunk)
                     
                     # Check size limit during upload
@@ -297,6 +493,7 @@ class FileHandler:
                             detail=f"Video file too large. Maximum size: {self.max_video_size / 1024 / 1024:.1f}MB"
                         )
                     
+                    hasher.update(chunk)
                     await f.write(chunk)
             
             # Get video info (basic)
@@ -309,6 +506,7 @@ class FileHandler:
                 "web_url": f"/uploads/videos/{filename}",
                 "file_size": file_size,
                 "file_size_mb": round(file_size / 1024 / 1024, 2),
+                "content_hash": hasher.hexdigest(),
                 "original_name": file.filename,
                 "content_type": file.content_type,
                 "upload_timestamp": datetime.now().isoformat(),
@@ -424,18 +622,23 @@ class FileHandler:
             
             for name, directory in directories:
                 if directory.exists():
-                    files = list(directory.glob("*"))
-                    total_size = sum(f.stat().st_size for f in files if f.is_file())
+                    # Single scandir pass: is_file() uses the cached dirent type
+                    file_count = total_size = 0
+                    with os.scandir(directory) as entries:
+                        for entry in entries:
+                            if entry.is_file(follow_symlinks=False):
+                                file_count += 1
+                                total_size += entry.stat().st_size
                     
                     stats["directories"][name] = {
                         "path": str(directory),
-                        "file_count": len([f for f in files if f.is_file()]),
+                        "file_count": file_count,
                         "total_size": total_size,
                         "total_size_mb": round(total_size / 1024 / 1024, 2)
                     }
                     
                     stats["total_size"] += total_size
-                    stats["total_files"] += len([f for f in files if f.is_file()])
+                    stats["total_files"] += file_count
                 else:
                     stats["directories"][name] = {
                         "path": str(directory),
@@ -453,31 +656,79 @@ class FileHandler:
         except Exception as e:
             return {"error": f"Could not get storage stats: {e}"}
     
-    def cleanup_orphaned_files(self) -> Dict[str, int]:
-        """Clean up orphaned files (files not referenced in database)"""
-        # This would require database integration to check which files are still referenced
-        # For now, return placeholder
-        return {
+    def cleanup_orphaned_files(self, db: Optional[Any] = None) -> Dict[str, int]:
+        """Clean up orphaned files (files not referenced in database)
+        
+        Referenced names are fetched up front (one UNION query plus the product
+        image lists), then each directory is scanned once and diffed as sets.
+        """
+        deleted_counts = {
             "images_deleted": 0,
             "videos_deleted": 0,
             "audio_deleted": 0,
             "thumbnails_deleted": 0
         }
+        if db is None:
+            return deleted_counts
+        
+        from sqlalchemy import select, union
+        from app.models.product import Product
+        from app.models.script import MP3File, Video, VoicePersona
+        
+        try:
+            referenced_query = union(
+                select(MP3File.file_path),
+                select(Video.file_path),
+                select(Video.thumbnail_path),
+                select(Product.thumbnail_url),
+                select(VoicePersona.sample_audio_path)
+            )
+            referenced = {Path(row[0]).name for row in db.execute(referenced_query) if row[0]}
+            for (images,) in db.execute(select(Product.images)):
+                if isinstance(images, str):
+                    images = json.loads(images)
+                referenced.update(Path(image).name for image in images or () if isinstance(image, str))
+        except Exception as e:
+            print(f"❌ Error loading referenced files: {e}")
+            return deleted_counts
+        
+        directories = [
+            ("images_deleted", self.image_dir),
+            ("videos_deleted", self.video_dir),
+            ("audio_deleted", self.audio_dir),
+            ("thumbnails_deleted", self.thumbnail_dir)
+        ]
+        
+        for key, directory in directories:
+            if not directory.exists():
+                continue
+            
+            with os.scandir(directory) as entries:
+                on_disk = {entry.name for entry in entries if entry.is_file(follow_symlinks=False)}
+            
+            orphans = on_disk - referenced
+            if directory == self.thumbnail_dir:
+                # Thumbnails are named thumb_<image filename>
+                orphans = {name for name in orphans if name[len("thumb_"):] not in referenced}
+            
+            for name in orphans:
+                try:
+                    os.unlink(directory / name)
+                    deleted_counts[key] += 1
+                except OSError as e:
+                    print(f"❌ Error deleting orphaned file {name}: {e}")
+        
+        return deleted_counts
     
     def validate_file_access(self, file_path: str, user_id: Optional[int] = None) -> bool:
         """Validate if user has access to a file"""
         try:
-            path = Path(file_path)
-            
-            # Check if file exists and is in allowed directories
-            allowed_dirs = [self.upload_dir, self.static_dir]
+            resolved = str(Path(file_path).resolve())
             
-            for allowed_dir in allowed_dirs:
-                try:
-                    path.resolve().relative_to(allowed_dir.resolve())
+            # Check if file is in allowed directories
+            for allowed_dir in self._resolved_allowed_dirs:
+                if os.path.commonpath((resolved, allowed_dir)) == allowed_dir:
                     return True
-                except ValueError:
-                    continue
             
             return False
             
@@ -485,6 +736,18 @@ class FileHandler:
             print(f"❌ File access validation error: {e}")
             return False
     
+    def file_response(self, file_path: str, filename: Optional[str] = None) -> FileResponse:
+        """Serve a stored file without reading it into memory
+        
+        FileResponse streams from disk and uses zero-copy sendfile when the
+        ASGI server supports it.
+        """
+        path = Path(file_path)
+        if not self.validate_file_access(file_path) or not path.is_file():
+            raise HTTPException(status_code=404, detail="File not found")
+        
+        return FileResponse(path, filename=filename)
+    
     def get_web_url(self, file_path: str) -> Optional[str]:
         """Convert file path to web-accessible URL"""
         try:
@@ -144,8 +144,10 @@ def test_connection():
     """Test database connection"""
     try:
         from app.core.database import engine
+        from sqlalchemy import text
+        
         with engine.connect() as conn:
-            result = conn.execute("SELECT 1")
+            result = conn.execute(text("SELECT 1"))
             print("✅ Database connection successful!")
             return True
     except Exception as e:
@@ -1,337 +1,393 @@
 #!/usr/bin/env python3
 import sys
 import os
+import functools
 from pathlib import Path
+from sqlalchemy import case, func, insert, select, text
+from sqlalchemy.engine import Connection
 from sqlalchemy.orm import Session
 
 # Add app directory to path
 sys.path.append(str(Path(__file__).parent))
 
-from app.core.database import engine, SessionLocal, create_tables
-from app.models.product import Product, ProductStatus
-from app.models.script import Script, ScriptPersona, VoicePersona, ScriptType, GenderType
-from app.models.user import User
-from app.core.security import SecurityManager
-
-def create_sample_personas(db: Session):
-    print("\n👤 Creating sample personas...")
-    
-    script_personas = [
-        {
-            "name": "Energetic Seller",
-            "description": "เซลส์มันส์ที่มีพลังและความกระตือรือร้นสูง",
-            "personality_traits": ["enthusiastic", "confident", "persuasive"],
-            "speaking_style": "พูดเร็ว เต็มไปด้วยพลัง",
-            "target_audience": "วัยรุ่น ผู้ซื้อแบบ impulse buy",
-            "system_prompt": "คุณเป็นเซลส์มันส์ที่มีพลังสูง พูดด้วยความตื่นเต้น",
-            "sample_phrases": ["สุดยอดมากครับ!", "เจ๋งจริงๆ เลย!"],
-            "tone_guidelines": "ใช้น้ำเสียงที่มีพลัง",
-            "do_say": ["สุดยอด", "เจ๋งมาก"],
-            "dont_say": ["อาจจะ", "ไม่แน่ใจ"],
-            "default_emotion": "excited",
-            "available_emotions": ["excited", "energetic"],
-            "sort_order": 1
-        }
-    ]
+# App modules (models, security/bcrypt) are imported inside the commands that
+# need them, so printing usage doesn't pay for them.
+
+# Rows per executemany() call when seeding. SQLite builds before 3.32 cap a
+# statement at 999 bound parameters (SQLITE_MAX_VARIABLE_NUMBER), which
+# insertmanyvalues pages around; 500 keeps each batch's memory bounded too.
+SEED_BATCH_SIZE = 500
+
+# Sample data is built once at import and reused by every seed run.
+# Enum columns are given member names ("ACTIVE", "FEMALE", ...), which
+# SQLAlchemy's Enum type accepts without importing the model enums here.
+_SCRIPT_PERSONAS = (
+    {
+        "name": "Energetic Seller",
+        "description": "เซลส์มันส์ที่มีพลังและความกระตือรือร้นสูง",
+        "personality_traits": ["enthusiastic", "confident", "persuasive"],
+        "speaking_style": "พูดเร็ว เต็มไปด้วยพลัง",
+        "target_audience": "วัยรุ่น ผู้ซื้อแบบ impulse buy",
+        "system_prompt": "คุณเป็นเซลส์มันส์ที่มีพลังสูง พูดด้วยความตื่นเต้น",
+        "sample_phrases": ["สุดยอดมากครับ!", "เจ๋งจริงๆ เลย!"],
+        "tone_guidelines": "ใช้น้ำเสียงที่มีพลัง",
+        "do_say": ["สุดยอด", "เจ๋งมาก"],
+        "dont_say": ["อาจจะ", "ไม่แน่ใจ"],
+        "default_emotion": "excited",
+        "available_emotions": ["excited", "energetic"],
+        "sort_order": 1
+    },
+)
+
+# Fields shared by every sample voice persona
+_VOICE_BASE = {
+    "language": "th",
+    "accent": "thai_central",
+    "volume": 1.0,
+    "is_active": True
+}
+
+_VOICE_PERSONAS = (
+    {
+        **_VOICE_BASE,
+        "name": "Professional Female",
+        "description": "เสียงหญิงมืออาชีพ เหมาะสำหรับการนำเสนอธุรกิจ",
+        "tts_provider": "edge",
+        "voice_id": "th-TH-PremwadeeNeural",
+        "gender": "FEMALE",
+        "age_range": "adult",
+        "speed": 0.9,
+        "pitch": 1.0,
+        "emotion": "professional",
+        "emotional_range": ["professional", "confident", "calm"],
+        "provider_settings": {"style": "general"},
+        "quality_rating": 5
+    },
+    {
+        **_VOICE_BASE,
+        "name": "Energetic Male",
+        "description": "เสียงชายร่าเริง เหมาะสำหรับการขายแบบมีพลัง",
+        "tts_provider": "edge",
+        "voice_id": "th-TH-NiwatNeural",
+        "gender": "MALE",
+        "age_range": "young",
+        "speed": 1.1,
+        "pitch": 1.1,
+        "emotion": "energetic",
+        "emotional_range": ["energetic", "excited", "confident"],
+        "provider_settings": {"style": "cheerful"},
+        "quality_rating": 4
+    },
+    {
+        **_VOICE_BASE,
+        "name": "Gentle Female",
+        "description": "เสียงหญิงอ่อนโยน เหมาะสำหรับสินค้าไลฟ์สไตล์",
+        "tts_provider": "google",
+        "voice_id": "th",
+        "gender": "FEMALE",
+        "age_range": "adult",
+        "speed": 0.8,
+        "pitch": 0.9,
+        "emotion": "gentle",
+        "emotional_range": ["gentle", "warm", "caring"],
+        "provider_settings": {},
+        "quality_rating": 3
+    },
+    {
+        **_VOICE_BASE,
+        "name": "Dynamic Male",
+        "description": "เสียงชายมีพลัง เหมาะสำหรับสินค้าเทคโนโลยี",
+        "tts_provider": "edge",
+        "voice_id": "th-TH-NiwatNeural",
+        "gender": "MALE",
+        "age_range": "adult",
+        "speed": 1.0,
+        "pitch": 1.0,
+        "emotion": "dynamic",
+        "emotional_range": ["dynamic", "confident", "professional"],
+        "provider_settings": {"style": "newscast"},
+        "quality_rating": 4
+    }
+)
+
+_PRODUCTS = (
+    {
+        "sku": "CAM-AI-4K-001",
+        "name": "AI Smart Camera Pro 4K",
+        "description": "กล้องอัจฉริยะ 4K พร้อมระบบ AI สำหรับรักษาความปลอดภัยบ้าน ตรวจจับการเคลื่อนไหวอัตโนมัติ บันทึกภาพคมชัดทั้งกลางวันและกลางคืน",
+        "price": 2999.00,
+        "original_price": 3999.00,
+        "discount_percentage": 25,
+        "category": "electronics",
+        "brand": "SmartHome Pro",
+        "stock_quantity": 50,
+        "key_features": [
+            "ความละเอียด 4K Ultra HD",
+            "ระบบ AI ตรวจจับการเคลื่อนไหว",
+            "Night Vision ชัดแม้ในที่มืด",
+            "แจ้งเตือนผ่าน Smartphone",
+            "บันทึกภาพลง Cloud Storage",
+            "กันน้ำ IP65",
+            "ติดตั้งง่าย ไร้สาย WiFi"
+        ],
+        "selling_points": [
+            "ประหยัดไฟ 70% เทียบรุ่นเก่า",
+            "รับประกัน 2 ปีเต็ม",
+            "ส่งฟรีทั่วประเทศ",
+            "ติดตั้งให้ฟรีในกรุงเทพ",
+            "รีวิวดี 4.8/5 ดาว"
+        ],
+        "target_audience": "เจ้าของบ้าน นักธุรกิจ ผู้ที่ห่วงความปลอดภัย",
+        "use_cases": [
+            "รักษาความปลอดภัยบ้าน",
+            "เฝ้าระวังร้านค้า",
+            "ดูแลผู้สูงอายุ",
+            "เฝ้าระวังสัตว์เลี้ยง"
+        ],
+        "promotion_text": "🔥 Flash Sale! ลด 25% เหลือเพียง 2,999 บาท (จากราคา 3,999 บาท) วันนี้เท่านั้น! พร้อมของแถมมูลค่า 500 บาท",
+        "warranty_info": "รับประกันสินค้า 2 ปี พร้อมบริการซ่อมฟรี",
+        "shipping_info": "ส่งฟรีทั่วประเทศ ได้รับภายใน 1-2 วัน",
+        "tags": ["camera", "security", "AI", "4K", "smart-home"],
+        "status": "ACTIVE"
+    },
+    {
+        "sku": "EAR-WL-PRO-002",
+        "name": "Wireless Earbuds Elite Pro",
+        "description": "หูฟังไร้สาย Premium พร้อมระบบตัดเสียงรบกวน Active Noise Cancelling คุณภาพเสียง Hi-Fi และแบตเตอรี่ทนนาน 8 ชั่วโมง",
+        "price": 1599.00,
+        "original_price": 2299.00,
+        "discount_percentage": 30,
+        "category": "electronics",
+        "brand": "AudioTech Elite",
+        "stock_quantity": 75,
+        "key_features": [
+            "Active Noise Cancelling (ANC)",
+            "คุณภาพเสียง Hi-Fi Premium",
+            "แบตเตอรี่ 8 ชั่วโมง + เคส 24 ชั่วโมง",
+            "กันน้ำ IPX7",
+            "Quick Charge 15 นาที = 2 ชั่วโมง",
+            "Touch Control สะดวก",
+            "เชื่อมต่อ Bluetooth 5.3"
+        ],
+        "selling_points": [
+            "เสียงเบสหนักแบบ Studio",
+            "ใส่สบาย ไม่หลุด",
+            "รองรับ iOS และ Android",
+            "มีแอพควบคุมเสียง",
+            "รีวิวจากดารา นักร้อง"
+        ],
+        "target_audience": "นักฟังเพลง นักกีฬา คนทำงาน Gen Y-Z",
+        "use_cases": [
+            "ฟังเพลงคุณภาพสูง",
+            "ออกกำลังกาย",
+            "Work from Home",
+            "เรียน Online",
+            "เดินทาง"
+        ],
+        "promotion_text": "💥 Super Sale! หูฟังระดับ Pro ลดราคาพิเศษ 30% เหลือ 1,599 บาท แถมฟรี เคสหนัง Premium มูลค่า 399 บาท!",
+        "status": "ACTIVE"
+    },
+    {
+        "sku": "HUB-SM-CTRL-003",
+        "name": "Smart Home Hub Central",
+        "description": "ศูนย์ควบคุมบ้านอัจฉริยะรุ่นใหม่ เชื่อมต่ออุปกรณ์ IoT ได้หลากหลาย ควบคุมผ่านเสียงและแอพ ประหยัดไฟอัตโนมัติ",
+        "price": 3999.00,
+        "category": "electronics",
+        "brand": "SmartLife Tech",
+        "stock_quantity": 30,
+        "key_features": [
+            "รองรับอุปกรณ์ 50+ ชิ้น",
+            "ควบคุมด้วยเสียง (Voice Control)",
+            "ตั้งเวลาอัตโนมัติ",
+            "ประหยัดไฟ 40%",
+            "รองรับ Alexa, Google Assistant",
+            "แอพ SmartLife ใช้ง่าย",
+            "ระบบรักษาความปลอดภัยขั้นสูง"
+        ],
+        "selling_points": [
+            "ติดตั้งง่าย 10 นาที",
+            "ประหยัดค่าไฟ 2,000 บาท/ปี",
+            "อัพเดท Feature ฟรีตลอดชีวิต",
+            "รองรับ Smart Device ทุกยี่ห้อ"
+        ],
+        "target_audience": "เจ้าของบ้าน คนรักเทคโนโลยี ครอบครัวยุคใหม่",
+        "status": "ACTIVE"
+    },
+    {
+        "sku": "KEY-GME-RGB-004",
+        "name": "Gaming Mechanical Keyboard RGB",
+        "description": "คีย์บอร์ดเกมมิ่งระดับโปร สวิตช์ Mechanical แท้ ไฟ RGB แบบ Custom พร้อม Macro Keys และ Anti-Ghosting เต็มรูปแบบ",
+        "price": 2599.00,
+        "category": "electronics",
+        "brand": "GamePro Elite",
+        "stock_quantity": 40,
+        "key_features": [
+            "สวิตช์ Mechanical Cherry MX Blue",
+            "ไฟ RGB 16.8 ล้านสี",
+            "Anti-Ghosting เต็มรูปแบบ",
+            "Macro Keys 12 ปุ่ม",
+            "โครงอลูมิเนียมแข็งแรง",
+            "ปุ่ม Multimedia พิเศษ",
+            "Cable ถอดได้"
+        ],
+        "selling_points": [
+            "ใช้ได้ทั้ง Gaming และ Office",
+            "เสียงการพิมพ์นุ่มหู",
+            "รับประกัน 3 ปี",
+            "รีวิวดีจาก Pro Gamer"
+        ],
+        "target_audience": "นักเล่นเกม โปรแกรมเมอร์ คนทำงานที่ใช้คอมนาน",
+        "status": "ACTIVE"
+    },
+    {
+        "sku": "SSD-PORT-1TB-005",
+        "name": "Portable SSD External 1TB",
+        "description": "SSD พกพาความเร็วสูง 1TB อ่านเขียนเร็วกว่า HDD ธรรมดา 10 เท่า ขนาดเล็ก เบา กันกระแทก เหมาะสำหรับงานกราฟิก วิดีโอ",
+        "price": 3499.00,
+        "category": "electronics",
+        "brand": "SpeedDrive Pro",
+        "stock_quantity": 60,
+        "key_features": [
+            "ความจุ 1TB (1,000 GB)",
+            "ความเร็วอ่าน 1,000 MB/s",
+            "ขนาดเล็ก 10x5x1 ซม.",
+            "น้ำหนักเบา 150 กรัม",
+            "กันกระแทก Military Grade",
+            "รองรับ USB-C และ USB-A",
+            "ใช้ได้ทั้ง Mac และ PC"
+        ],
+        "selling_points": [
+            "เร็วกว่า HDD ธรรมดา 10 เท่า",
+            "ประหยัดพื้นที่ 90%",
+            "ไม่มีเสียงรบกวน",
+            "ประหยัดไฟ 70%"
+        ],
+        "target_audience": "นักออกแบบ โปรแกรมเมอร์ ช่างภาพ คนทำวิดีโอ",
+        "status": "ACTIVE"
+    },
+    {
+        "sku": "CHG-WL-STAND-006",
+        "name": "Wireless Charging Stand Pro",
+        "description": "แท่นชาร์จไร้สายแบบตั้ง รองรับ Fast Charging 15W พร้อมพัดลมระบายความร้อนในตัว ชาร์จได้ทั้งแนวตั้งและแนวนอน",
+        "price": 899.00,
+        "original_price": 1299.00,
+        "discount_percentage": 31,
+        "category": "electronics",
+        "brand": "ChargeTech Pro",
+        "stock_quantity": 80,
+        "key_features": [
+            "Fast Charging 15W",
+            "รองรับ iPhone และ Samsung",
+            "พัดลมระบายความร้อนอัตโนมัติ",
+            "ชาร์จได้ 2 ท่า (ตั้ง/นอน)",
+            "ไฟ LED แสดงสถานะ",
+            "ระบบป้องกันไฟเกิน",
+            "โครงอลูมิเนียมแข็งแรง"
+        ],
+        "selling_points": [
+            "ชาร์จเร็วกว่าสาย USB ธรรมดา",
+            "ปลอดภัย 100% ไม่ไฟไหม้",
+            "ใช้ขณะดูหนัง Video Call ได้",
+            "ประหยัดสายชาร์จ"
+        ],
+        "target_audience": "คนทำงาน สาย Gadget ผู้ใช้ Smartphone รุ่นใหม่",
+        "promotion_text": "🎁 ลดพิเศษ 31% เหลือ 899 บาท พร้อมแถมสายชาร์จ Type-C ฟรี! จำนวนจำกัด",
+        "status": "ACTIVE"
+    }
+)
+
+SEED_SCRIPTS_DIR = Path(__file__).parent / "seeds" / "scripts"
+
+@functools.lru_cache(maxsize=None)
+def _tmpl(name: str) -> str:
+    """Read a seed script body from seeds/scripts/ (once per process)"""
+    return (SEED_SCRIPTS_DIR / name).read_text(encoding="utf-8").rstrip("\n")
+
+# Sample scripts, paired in order with the first products and personas.
+# Bodies live in seeds/scripts/ and are only read when scripts are seeded.
+_SAMPLE_SCRIPTS = (
+    {
+        "title": "AI Smart Camera - Energetic Introduction",
+        "content_template": "camera_energetic.txt",
+        "script_type": "AI_GENERATED",
+        "target_emotion": "excited",
+        "call_to_action": "สั่งเลยครับ! ไม่สั่งเสียดาย! 🛒",
+        "duration_estimate": 75
+    },
+    {
+        "title": "Wireless Earbuds - Professional Review",
+        "content_template": "earbuds_professional.txt",
+        "script_type": "AI_GENERATED",
+        "target_emotion": "professional",
+        "call_to_action": "สั่งซื้อได้ทันทีครับ รับรองคุณภาพระดับสากล",
+        "duration_estimate": 85
+    },
+    {
+        "title": "Smart Home Hub - Friendly Recommendation",
+        "content_template": "hub_friendly.txt",
+        "script_type": "AI_GENERATED",
+        "target_emotion": "friendly",
+        "call_to_action": "ลองดูนะครับ รับรองว่าคุ้มค่าจริงๆ 😊",
+        "duration_estimate": 70
+    }
+)
+
+def _insert_rows(conn: Connection, model, rows, batch_size: int = SEED_BATCH_SIZE):
+    """Core executemany needs uniform keys, so insert one batch per key set"""
+    batches = {}
+    for row in rows:
+        batches.setdefault(frozenset(row), []).append(row)
+    for batch in batches.values():
+        for i in range(0, len(batch), batch_size):
+            conn.execute(insert(model), batch[i:i + batch_size])
+
+def create_sample_personas(conn: Connection, events: list):
+    from app.models.script import ScriptPersona, VoicePersona
+    
+    events.append("\n👤 Creating sample personas...")
     
     # ส่วนที่มีอยู่แล้วของคุณจะอยู่ตรงนี้
 
-    for persona_data in script_personas:
-        persona = ScriptPersona(**persona_data)
-        db.add(persona)
+    _insert_rows(conn, ScriptPersona, _SCRIPT_PERSONAS)
     
     # Voice Personas
-    voice_personas = [
-        {
-            "name": "Professional Female",
-            "description": "เสียงหญิงมืออาชีพ เหมาะสำหรับการนำเสนอธุรกิจ",
-            "tts_provider": "edge",
-            "voice_id": "th-TH-PremwadeeNeural",
-            "language": "th",
-            "gender": GenderType.FEMALE,
-            "age_range": "adult",
-            "accent": "thai_central",
-            "speed": 0.9,
-            "pitch": 1.0,
-            "volume": 1.0,
-            "emotion": "professional",
-            "emotional_range": ["professional", "confident", "calm"],
-            "provider_settings": {"style": "general"},
-            "quality_rating": 5,
-            "is_active": True
-        },
-        {
-            "name": "Energetic Male",
-            "description": "เสียงชายร่าเริง เหมาะสำหรับการขายแบบมีพลัง",
-            "tts_provider": "edge",
-            "voice_id": "th-TH-NiwatNeural",
-            "language": "th",
-            "gender": GenderType.MALE,
-            "age_range": "young",
-            "accent": "thai_central",
-            "speed": 1.1,
-            "pitch": 1.1,
-            "volume": 1.0,
-            "emotion": "energetic",
-            "emotional_range": ["energetic", "excited", "confident"],
-            "provider_settings": {"style": "cheerful"},
-            "quality_rating": 4,
-            "is_active": True
-        },
-        {
-            "name": "Gentle Female",
-            "description": "เสียงหญิงอ่อนโยน เหมาะสำหรับสินค้าไลฟ์สไตล์",
-            "tts_provider": "google",
-            "voice_id": "th",
-            "language": "th",
-            "gender": GenderType.FEMALE,
-            "age_range": "adult",
-            "accent": "thai_central",
-            "speed": 0.8,
-            "pitch": 0.9,
-            "volume": 1.0,
-            "emotion": "gentle",
-            "emotional_range": ["gentle", "warm", "caring"],
-            "provider_settings": {},
-            "quality_rating": 3,
-            "is_active": True
-        },
-        {
-            "name": "Dynamic Male",
-            "description": "เสียงชายมีพลัง เหมาะสำหรับสินค้าเทคโนโลยี",
-            "tts_provider": "edge",
-            "voice_id": "th-TH-NiwatNeural",
-            "language": "th",
-            "gender": GenderType.MALE,
-            "age_range": "adult",
-            "accent": "thai_central",
-            "speed": 1.0,
-            "pitch": 1.0,
-            "volume": 1.0,
-            "emotion": "dynamic",
-            "emotional_range": ["dynamic", "confident", "professional"],
-            "provider_settings": {"style": "newscast"},
-            "quality_rating": 4,
-            "is_active": True
-        }
-    ]
+    _insert_rows(conn, VoicePersona, _VOICE_PERSONAS)
     
-    for voice_data in voice_personas:
-        voice = VoicePersona(**voice_data)
-        db.add(voice)
-    
-    print(f"✅ Created {len(script_personas)} script personas and {len(voice_personas)} voice personas")
+    events.append(f"✅ Created {len(_SCRIPT_PERSONAS)} script personas and {len(_VOICE_PERSONAS)} voice personas")
 
-def create_sample_products(db: Session):
+def create_sample_products(conn: Connection, events: list):
     """Create sample products with detailed information for AI script generation"""
-    print("\n📦 Creating sample products...")
+    from app.models.product import Product
     
-    products = [
-        {
-            "sku": "CAM-AI-4K-001",
-            "name": "AI Smart Camera Pro 4K",
-            "description": "กล้องอัจฉริยะ 4K พร้อมระบบ AI สำหรับรักษาความปลอดภัยบ้าน ตรวจจับการเคลื่อนไหวอัตโนมัติ บันทึกภาพคมชัดทั้งกลางวันและกลางคืน",
-            "price": 2999.00,
-            "original_price": 3999.00,
-            "discount_percentage": 25,
-            "category": "electronics",
-            "brand": "SmartHome Pro",
-            "stock_quantity": 50,
-            "key_features": [
-                "ความละเอียด 4K Ultra HD",
-                "ระบบ AI ตรวจจับการเคลื่อนไหว",
-                "Night Vision ชัดแม้ในที่มืด",
-                "แจ้งเตือนผ่าน Smartphone",
-                "บันทึกภาพลง Cloud Storage",
-                "กันน้ำ IP65",
-                "ติดตั้งง่าย ไร้สาย WiFi"
-            ],
-            "selling_points": [
-                "ประหยัดไฟ 70% เทียบรุ่นเก่า",
-                "รับประกัน 2 ปีเต็ม",
-                "ส่งฟรีทั่วประเทศ",
-                "ติดตั้งให้ฟรีในกรุงเทพ",
-                "รีวิวดี 4.8/5 ดาว"
-            ],
-            "target_audience": "เจ้าของบ้าน นักธุรกิจ ผู้ที่ห่วงความปลอดภัย",
-            "use_cases": [
-                "รักษาความปลอดภัยบ้าน",
-                "เฝ้าระวังร้านค้า",
-                "ดูแลผู้สูงอายุ",
-                "เฝ้าระวังสัตว์เลี้ยง"
-            ],
-            "promotion_text": "🔥 Flash Sale! ลด 25% เหลือเพียง 2,999 บาท (จากราคา 3,999 บาท) วันนี้เท่านั้น! พร้อมของแถมมูลค่า 500 บาท",
-            "warranty_info": "รับประกันสินค้า 2 ปี พร้อมบริการซ่อมฟรี",
-            "shipping_info": "ส่งฟรีทั่วประเทศ ได้รับภายใน 1-2 วัน",
-            "tags": ["camera", "security", "AI", "4K", "smart-home"],
-            "status": ProductStatus.ACTIVE
-        },
-        {
-            "sku": "EAR-WL-PRO-002",
-            "name": "Wireless Earbuds Elite Pro",
-            "description": "หูฟังไร้สาย Premium พร้อมระบบตัดเสียงรบกวน Active Noise Cancelling คุณภาพเสียง Hi-Fi และแบตเตอรี่ทนนาน 8 ชั่วโมง",
-            "price": 1599.00,
-            "original_price": 2299.00,
-            "discount_percentage": 30,
-            "category": "electronics",
-            "brand": "AudioTech Elite",
-            "stock_quantity": 75,
-            "key_features": [
-                "Active Noise Cancelling (ANC)",
-                "คุณภาพเสียง Hi-Fi Premium",
-                "แบตเตอรี่ 8 ชั่วโมง + เคส 24 ชั่วโมง",
-                "กันน้ำ IPX7",
-                "Quick Charge 15 นาที = 2 ชั่วโมง",
-                "Touch Control สะดวก",
-                "เชื่อมต่อ Bluetooth 5.3"
-            ],
-            "selling_points": [
-                "เสียงเบสหนักแบบ Studio",
-                "ใส่สบาย ไม่หลุด",
-                "รองรับ iOS และ Android",
-                "มีแอพควบคุมเสียง",
-                "รีวิวจากดารา นักร้อง"
-            ],
-            "target_audience": "นักฟังเพลง นักกีฬา คนทำงาน Gen Y-Z",
-            "use_cases": [
-                "ฟังเพลงคุณภาพสูง",
-                "ออกกำลังกาย",
-                "Work from Home",
-                "เรียน Online",
-                "เดินทาง"
-            ],
-            "promotion_text": "💥 Super Sale! หูฟังระดับ Pro ลดราคาพิเศษ 30% เหลือ 1,599 บาท แถมฟรี เคสหนัง Premium มูลค่า 399 บาท!",
-            "status": ProductStatus.ACTIVE
-        },
-        {
-            "sku": "HUB-SM-CTRL-003",
-            "name": "Smart Home Hub Central",
-            "description": "ศูนย์ควบคุมบ้านอัจฉริยะรุ่นใหม่ เชื่อมต่ออุปกรณ์ IoT ได้หลากหลาย ควบคุมผ่านเสียงและแอพ ประหยัดไฟอัตโนมัติ",
-            "price": 3999.00,
-            "category": "electronics",
-            "brand": "SmartLife Tech",
-            "stock_quantity": 30,
-            "key_features": [
-                "รองรับอุปกรณ์ 50+ ชิ้น",
-                "ควบคุมด้วยเสียง (Voice Control)",
-                "ตั้งเวลาอัตโนมัติ",
-                "ประหยัดไฟ 40%",
-                "รองรับ Alexa, Google Assistant",
-                "แอพ SmartLife ใช้ง่าย",
-                "ระบบรักษาความปลอดภัยขั้นสูง"
-            ],
-            "selling_points": [
-                "ติดตั้งง่าย 10 นาที",
-                "ประหยัดค่าไฟ 2,000 บาท/ปี",
-                "อัพเดท Feature ฟรีตลอดชีวิต",
-                "รองรับ Smart Device ทุกยี่ห้อ"
-            ],
-            "target_audience": "เจ้าของบ้าน คนรักเทคโนโลยี ครอบครัวยุคใหม่",
-            "status": ProductStatus.ACTIVE
-        },
-        {
-            "sku": "KEY-GME-RGB-004",
-            "name": "Gaming Mechanical Keyboard RGB",
-            "description": "คีย์บอร์ดเกมมิ่งระดับโปร สวิตช์ Mechanical แท้ ไฟ RGB แบบ Custom พร้อม Macro Keys และ Anti-Ghosting เต็มรูปแบบ",
-            "price": 2599.00,
-            "category": "electronics",
-            "brand": "GamePro Elite",
-            "stock_quantity": 40,
-            "key_features": [
-                "สวิตช์ Mechanical Cherry MX Blue",
-                "ไฟ RGB 16.8 ล้านสี",
-                "Anti-Ghosting เต็มรูปแบบ",
-                "Macro Keys 12 ปุ่ม",
-                "โครงอลูมิเนียมแข็งแรง",
-                "ปุ่ม Multimedia พิเศษ",
-                "Cable ถอดได้"
-            ],
-            "selling_points": [
-                "ใช้ได้ทั้ง Gaming และ Office",
-                "เสียงการพิมพ์นุ่มหู",
-                "รับประกัน 3 ปี",
-                "รีวิวดีจาก Pro Gamer"
-            ],
-            "target_audience": "นักเล่นเกม โปรแกรมเมอร์ คนทำงานที่ใช้คอมนาน",
-            "status": ProductStatus.ACTIVE
-        },
-        {
-            "sku": "SSD-PORT-1TB-005",
-            "name": "Portable SSD External 1TB",
-            "description": "SSD พกพาความเร็วสูง 1TB อ่านเขียนเร็วกว่า HDD ธรรมดา 10 เท่า ขนาดเล็ก เบา กันกระแทก เหมาะสำหรับงานกราฟิก วิดีโอ",
-            "price": 3499.00,
-            "category": "electronics",
-            "brand": "SpeedDrive Pro",
-            "stock_quantity": 60,
-            "key_features": [
-                "ความจุ 1TB (1,000 GB)",
-                "ความเร็วอ่าน 1,000 MB/s",
-                "ขนาดเล็ก 10x5x1 ซม.",
-                "น้ำหนักเบา 150 กรัม",
-                "กันกระแทก Military Grade",
-                "รองรับ USB-C และ USB-A",
-                "ใช้ได้ทั้ง Mac และ PC"
-            ],
-            "selling_points": [
-                "เร็วกว่า HDD ธรรมดา 10 เท่า",
-                "ประหยัดพื้นที่ 90%",
-                "ไม่มีเสียงรบกวน",
-                "ประหยัดไฟ 70%"
-            ],
-            "target_audience": "นักออกแบบ โปรแกรมเมอร์ ช่างภาพ คนทำวิดีโอ",
-            "status": ProductStatus.ACTIVE
-        },
-        {
-            "sku": "CHG-WL-STAND-006",
-            "name": "Wireless Charging Stand Pro",
-            "description": "แท่นชาร์จไร้สายแบบตั้ง รองรับ Fast Charging 15W พร้อมพัดลมระบายความร้อนในตัว ชาร์จได้ทั้งแนวตั้งและแนวนอน",
-            "price": 899.00,
-            "original_price": 1299.00,
-            "discount_percentage": 31,
-            "category": "electronics",
-            "brand": "ChargeTech Pro",
-            "stock_quantity": 80,
-            "key_features": [
-                "Fast Charging 15W",
-                "รองรับ iPhone และ Samsung",
-                "พัดลมระบายความร้อนอัตโนมัติ",
-                "ชาร์จได้ 2 ท่า (ตั้ง/นอน)",
-                "ไฟ LED แสดงสถานะ",
-                "ระบบป้องกันไฟเกิน",
-                "โครงอลูมิเนียมแข็งแรง"
-            ],
-            "selling_points": [
-                "ชาร์จเร็วกว่าสาย USB ธรรมดา",
-                "ปลอดภัย 100% ไม่ไฟไหม้",
-                "ใช้ขณะดูหนัง Video Call ได้",
-                "ประหยัดสายชาร์จ"
-            ],
-            "target_audience": "คนทำงาน สาย Gadget ผู้ใช้ Smartphone รุ่นใหม่",
-            "promotion_text": "🎁 ลดพิเศษ 31% เหลือ 899 บาท พร้อมแถมสายชาร์จ Type-C ฟรี! จำนวนจำกัด",
-            "status": ProductStatus.ACTIVE
-        }
-    ]
+    events.append("\n📦 Creating sample products...")
     
-    for product_data in products:
-        product = Product(**product_data)
-        db.add(product)
+    _insert_rows(conn, Product, _PRODUCTS)
     
-    print(f"✅ Created {len(products)} sample products")
+    events.append(f"✅ Created {len(_PRODUCTS)} sample products")
 
-def create_sample_user(db: Session):
+@functools.lru_cache(maxsize=128)
+def _hash_password_cached(password: str) -> str:
+    """bcrypt hash for fixed seed passwords; never use for real accounts"""
+    from app.core.security import SecurityManager
+    
+    return SecurityManager.get_password_hash(password)
+
+def create_sample_user(conn: Connection, events: list):
     """Create demo user"""
-    print("\n👤 Creating demo user...")
+    from app.models.user import User
+    
+    events.append("\n👤 Creating demo user...")
     
     # Check if demo user already exists
-    existing_user = db.query(User).filter(User.email == "demo@example.com").first()
-    if existing_user:
-        print("ℹ️ Demo user already exists")
+    exists_q = select(User.id).where(User.email == "demo@example.com").limit(1)
+    if conn.execute(exists_q).first():
+        events.append("ℹ️ Demo user already exists")
         return
     
-    demo_user = User(
+    conn.execute(insert(User).values(
         email="demo@example.com",
         username="demo",
-        hashed_password=SecurityManager.get_password_hash("demo123"),
+        hashed_password=_hash_password_cached("demo123"),
         full_name="Demo User",
         is_active=True,
         is_superuser=False,
@@ -340,122 +396,88 @@ def create_sample_user(db: Session):
             "language": "th",
             "notifications": True
         }
+    ))
+    events.append(
+        "✅ Created demo user:\n"
+        "   📧 Email: demo@example.com\n"
+        "   👤 Username: demo\n"
+        "   🔑 Password: demo123"
     )
-    
-    db.add(demo_user)
-    print("✅ Created demo user:")
-    print("   📧 Email: demo@example.com")
-    print("   👤 Username: demo")
-    print("   🔑 Password: demo123")
 
-def create_sample_scripts(db: Session):
+def _first_n_ids(conn: Connection, model, n=None):
+    """Primary keys of the first n rows of model (all rows when n is None)"""
+    query = select(model.id)
+    if n is not None:
+        query = query.limit(n)
+    return tuple(conn.execute(query).scalars())
+
+def create_sample_scripts(conn: Connection, events: list):
     """Create sample scripts for some products"""
-    print("\n📝 Creating sample scripts...")
+    from app.models.product import Product
+    from app.models.script import Script, ScriptPersona
+    
+    events.append("\n📝 Creating sample scripts...")
     
-    # Get first 3 products and personas
-    products = db.query(Product).limit(3).all()
-    personas = db.query(ScriptPersona).all()
+    # Get first 3 product ids and all persona ids (no ORM hydration needed)
+    product_ids = _first_n_ids(conn, Product, len(_SAMPLE_SCRIPTS))
+    persona_ids = _first_n_ids(conn, ScriptPersona)
     
-    if not products or not personas:
-        print("⚠️ No products or personas found, skipping scripts")
+    if not product_ids or not persona_ids:
+        events.append("⚠️ No products or personas found, skipping scripts")
         return
     
-    sample_scripts = []
-    
-    # Script for AI Smart Camera
-    if len(products) > 0:
-        camera_scripts = [
-            {
-                "product_id": products[0].id,
-                "persona_id": personas[0].id if personas else None,
-                "title": "AI Smart Camera - Energetic Introduction",
-                "content": """{excited}สวัสดีครับทุกคน! วันนี้มีข่าวดีมาแชร์กันครับ!{/excited} 
-
-{confident}ขอแนะนำ AI Smart Camera Pro 4K กล้องอัจฉริยะที่จะเปลี่ยนบ้านของคุณให้เป็น Smart Home แบบมืออาชีพ!{/confident}
-
-🌟 ไฮไลท์พิเศษ:
-• {excited}ความละเอียด 4K Ultra HD ชัดแบบโครตแตก!{/excited}
-• ระบบ AI ตรวจจับการเคลื่อนไหวอัตโนมัติ แจ้งเตือนทันที
-• {confident}Night Vision ชัดแม้ในที่มืดมิด เหมือนมีไฟเปิด{/confident}
-• กันน้ำ IP65 ฝนตกลายฟ้าผ่าก็ไม่กลัว!
-
-{urgent}🔥 Flash Sale วันนี้เท่านั้น! ลดราคาพิเศษ 25% จาก 3,999 เหลือเพียง 2,999 บาท พร้อมของแถมมูลค่า 500 บาท!{/urgent}
-
-{excited}รีบสั่งเลยครับ! เหลือไม่เยอะแล้ว ไม่สั่งเสียดายแน่นอน! 🛒{/excited}""",
-                "script_type": ScriptType.AI_GENERATED,
-                "target_emotion": "excited",
-                "call_to_action": "สั่งเลยครับ! ไม่สั่งเสียดาย! 🛒",
-                "duration_estimate": 75
-            }
-        ]
-        sample_scripts.extend(camera_scripts)
-    
-    # Script for Wireless Earbuds
-    if len(products) > 1:
-        earbuds_scripts = [
-            {
-                "product_id": products[1].id,
-                "persona_id": personas[1].id if len(personas) > 1 else personas[0].id,
-                "title": "Wireless Earbuds - Professional Review",
-                "content": """{professional}สวัสดีครับ ยินดีต้อนรับทุกท่านสู่การนำเสนอสินค้าพิเศษ{/professional}
-
-{confident}ในฐานะผู้เชี่ยวชาญด้านเทคโนโลยีเสียง วันนี้ขอแนะนำ Wireless Earbuds Elite Pro หูฟังไร้สายระดับ Premium ที่จะเปลี่ยนประสบการณ์การฟังเพลงของคุณ{/confident}
-
-🎵 คุณสมบัติโดดเด่น:
-• {trustworthy}Active Noise Cancelling ตัดเสียงรบกวนได้ 95%{/trustworthy}
-• คุณภาพเสียง Hi-Fi เทียบเท่าสตูดิโอระดับมืออาชีพ
-• แบตเตอรี่ยาวนาน 8+24 ชั่วโมง ใช้ได้ทั้งวัน
-• {professional}กันน้ำ IPX7 ใส่ออกกำลังกายได้อย่างมั่นใจ{/professional}
-
-{confident}ประสบการณ์จากการทดสอบ: เสียงเบสหนัก treble ใส ไม่บิดเบือน เหมาะสำหรับทุกแนวเพลง{/confident}
-
-💰 ราคาพิเศษ: จาก 2,299 บาท ลดเหลือ 1,599 บาท ประหยัด 700 บาท พร้อมเคสหนัง Premium ฟรี!
-
-{professional}สั่งซื้อได้ทันทีครับ รับรองคุณภาพระดับสากล{/professional}""",
-                "script_type": ScriptType.AI_GENERATED,
-                "target_emotion": "professional",
-                "call_to_action": "สั่งซื้อได้ทันทีครับ รับรองคุณภาพระดับสากล",
-                "duration_estimate": 85
-            }
-        ]
-        sample_scripts.extend(earbuds_scripts)
-    
-    # Script for Smart Home Hub  
-    if len(products) > 2:
-        hub_scripts = [
-            {
-                "product_id": products[2].id,
-                "persona_id": personas[2].id if len(personas) > 2 else personas[0].id,
-                "title": "Smart Home Hub - Friendly Recommendation",
-                "content": """{friendly}สวัสดีครับเพื่อนๆ มาเจอกันอีกแล้วนะครับ 😊{/friendly}
-
-{warm}วันนี้อยากแชร์สินค้าที่ช่วยให้บ้านผมสะดวกขึ้นมากเลย Smart Home Hub Central ศูนย์ควบคุมบ้านอัจฉริยะที่ใช้ง่ายจริงๆ{/warm}
-
-{honest}บอกตามตรงนะครับ ตอนแรกก็ไม่เชื่อหรอกว่าจะดีขนาดนั้น แต่ลองใช้ดูแล้วติดใจเลย!{/honest}
-
-✨ สิ่งที่ผมชอบมากๆ:
-• ควบคุมไฟ แอร์ ทีวี ด้วยเสียงพูด "เปิดไฟห้องนอน" ก็เปิดเลย
-• {caring}ตั้งเวลาให้อุปกรณ์เปิด-ปิดอัตโนมัติ ประหยัดไฟได้จริงๆ{/caring}
-• ติดตั้งง่าย 10 นาทีเสร็จ ไม่ต้องเรียกช่าง
-• {warm}ลูกๆ ก็ใช้ได้ ผู้ปกครองคุมได้ด้วย{/warm}
-
-💰 ราคา 3,999 บาท คุ้มมากเทียบกับที่ได้ บ้านเป็น Smart Home เต็มๆ
-
-{friendly}ลองดูนะครับ รับรองว่าคุ้มค่าจริงๆ แถมประหยัดค่าไฟด้วย 😊{/friendly}""",
-                "script_type": ScriptType.AI_GENERATED,
-                "target_emotion": "friendly",
-                "call_to_action": "ลองดูนะครับ รับรองว่าคุ้มค่าจริงๆ 😊",
-                "duration_estimate": 70
-            }
-        ]
-        sample_scripts.extend(hub_scripts)
+    # Scripts for AI Smart Camera, Wireless Earbuds and Smart Home Hub
+    sample_scripts = [
+        {
+            **{k: v for k, v in script_data.items() if k != "content_template"},
+            "content": _tmpl(script_data["content_template"]),
+            "product_id": product_id,
+            "persona_id": persona_ids[i] if len(persona_ids) > i else persona_ids[0]
+        }
+        for i, (product_id, script_data) in enumerate(zip(product_ids, _SAMPLE_SCRIPTS))
+    ]
     
     # Save scripts to database
-    for script_data in sample_scripts:
-        script = Script(**script_data)
-        db.add(script)
-    
-    print(f"✅ Created {len(sample_scripts)} sample scripts with emotional markup")
+    _insert_rows(conn, Script, sample_scripts)
+    
+    events.append(f"✅ Created {len(sample_scripts)} sample scripts with emotional markup")
+
+def _count_if(condition):
+    """SUM(CASE WHEN condition THEN 1 ELSE 0 END), 0 on an empty table"""
+    return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+
+def get_table_counts(db: Session):
+    """Row counts for the main tables in one round-trip"""
+    from app.models.script import Script, ScriptPersona, VoicePersona
+    from app.models.user import User
+    
+    return db.execute(select(
+        select(func.count(User.id)).scalar_subquery(),
+        select(func.count(Script.id)).scalar_subquery(),
+        select(func.count(ScriptPersona.id)).scalar_subquery(),
+        select(func.count(VoicePersona.id)).scalar_subquery(),
+    )).one()
+
+def get_product_breakdown(db: Session):
+    """(total, active, on sale, total stock) in a single pass over products"""
+    from app.models.product import Product, ProductStatus
+    
+    return db.execute(select(
+        func.count(Product.id),
+        _count_if(Product.status == ProductStatus.ACTIVE),
+        _count_if(Product.discount_percentage > 0),
+        func.coalesce(func.sum(Product.stock_quantity), 0),
+    )).one()
+
+def get_script_breakdown(db: Session):
+    """(AI generated, manual, with MP3) in a single pass over scripts"""
+    from app.models.script import Script, ScriptType
+    
+    return db.execute(select(
+        _count_if(Script.script_type == ScriptType.AI_GENERATED),
+        _count_if(Script.script_type == ScriptType.MANUAL),
+        _count_if(Script.has_mp3 == True),
+    )).one()
 
 def display_summary(db: Session):
     """Display database summary"""
@@ -464,11 +486,8 @@ def display_summary(db: Session):
     print("=" * 60)
     
     # Count records
-    user_count = db.query(User).count()
-    product_count = db.query(Product).count()
-    script_count = db.query(Script).count()
-    script_persona_count = db.query(ScriptPersona).count()
-    voice_persona_count = db.query(VoicePersona).count()
+    user_count, script_count, script_persona_count, voice_persona_count = get_table_counts(db)
+    product_count, active_products, featured_products, total_stock = get_product_breakdown(db)
     
     print(f"👥 Users: {user_count}")
     print(f"📦 Products: {product_count}")
@@ -477,15 +496,12 @@ def display_summary(db: Session):
     print(f"🎵 Voice Personas: {voice_persona_count}")
     
     # Product details
-    active_products = db.query(Product).filter(Product.status == ProductStatus.ACTIVE).count()
     print(f"✅ Active Products: {active_products}")
     
     # Featured products
-    featured_products = db.query(Product).filter(Product.discount_percentage > 0).count()
     print(f"⭐ Featured Products (On Sale): {featured_products}")
     
     # Total stock
-    total_stock = db.query(func.sum(Product.stock_quantity)).scalar() or 0
     print(f"📦 Total Stock: {total_stock} units")
     
     print("\n🎉 Database initialization completed successfully!")
@@ -493,8 +509,11 @@ def display_summary(db: Session):
     print("📱 Dashboard: http://localhost:8000")
     print("📚 API Docs: http://localhost:8000/docs")
 
-def reset_database():
-    """Reset database (delete all data)"""
+def reset_database(full: bool = False):
+    """Reset database (delete all data; full=True also rebuilds the schema)"""
+    from sqlalchemy import inspect
+    from app.core.database import engine
+    
     print("⚠️ DANGER: This will delete ALL data in the database!")
     confirm = input("Type 'RESET' to confirm: ")
     
@@ -505,14 +524,24 @@ def reset_database():
     try:
         print("🗄️ Resetting database...")
         
-        # Drop all tables
         from app.models.base import Base
-        Base.metadata.drop_all(bind=engine)
-        print("✅ All tables dropped")
         
-        # Recreate tables
-        Base.metadata.create_all(bind=engine)
-        print("✅ Tables recreated")
+        if full:
+            # Drop all tables
+            Base.metadata.drop_all(bind=engine)
+            print("✅ All tables dropped")
+            
+            # Recreate tables
+            Base.metadata.create_all(bind=engine)
+            print("✅ Tables recreated")
+        else:
+            # Keep the schema; empty tables children-first so FKs never dangle
+            with engine.begin() as conn:
+                existing = set(inspect(conn).get_table_names())
+                for table in reversed(Base.metadata.sorted_tables):
+                    if table.name in existing:
+                        conn.execute(table.delete())
+            print("✅ All tables emptied")
         
         print("✅ Database reset completed!")
         return True
@@ -523,6 +552,8 @@ def reset_database():
 
 def test_connection():
     """Test database connection"""
+    from app.core.database import SessionLocal
+    
     try:
         print("🔍 Testing database connection...")
         
@@ -541,9 +572,16 @@ def test_connection():
             """)).fetchall()
             
             print(f"📋 Found {len(tables)} tables:")
-            for table in tables:
-                count = db.execute(text(f"SELECT COUNT(*) FROM {table[0]}")).scalar()
-                print(f"   • {table[0]}: {count} records")
+            # Names come straight from sqlite_master; still only accept plain identifiers
+            names = [table[0] for table in tables if table[0].isidentifier()]
+            if names:
+                # One statement, parsed and planned once for every table
+                counts_sql = " UNION ALL ".join(
+                    f"SELECT '{name}' AS t, (SELECT COUNT(*) FROM \"{name}\") AS c" for name in names
+                )
+                counts = dict(db.execute(text(counts_sql)).all())
+                for name in names:
+                    print(f"   • {name}: {counts[name]} records")
         
         db.close()
         return True
@@ -552,8 +590,22 @@ def test_connection():
         print(f"❌ Database connection failed: {e}")
         return False
 
-def init_database():
+def drop_secondary_indexes(conn: Connection):
+    """Drop non-unique indexes so bulk seeding skips per-row index maintenance"""
+    from app.models.base import Base
+    
+    dropped = []
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            if not index.unique:
+                index.drop(bind=conn, checkfirst=True)
+                dropped.append(index)
+    return dropped
+
+def init_database(fast_seed: bool = False):
     """Initialize database with tables and sample data"""
+    from app.core.database import engine, create_tables
+    
     print("🗄️ Initializing AI Live Commerce Database...")
     print("=" * 60)
     
@@ -563,28 +615,37 @@ def init_database():
         create_tables()
         print("✅ Database tables created successfully!")
         
-        # Create session
-        db = SessionLocal()
+        # Seed progress is buffered and written in one go at the end
+        events = []
         
         try:
-            # Create sample data
-            create_sample_personas(db)
-            create_sample_products(db)
-            create_sample_user(db)
-            create_sample_scripts(db)
+            # One transaction for every seed step; commits on success, rolls back on error
+            with engine.begin() as conn:
+                # Indexes are rebuilt once after seeding, inside the same transaction
+                dropped_indexes = drop_secondary_indexes(conn) if fast_seed else []
+                
+                # Create sample data
+                create_sample_personas(conn, events)
+                create_sample_products(conn, events)
+                create_sample_user(conn, events)
+                create_sample_scripts(conn, events)
+                
+                for index in dropped_indexes:
+                    index.create(bind=conn)
             
-            db.commit()
+            print("\n".join(events), flush=True)
+            events.clear()
             print("✅ All sample data created successfully!")
             
             # Display summary
-            display_summary(db)
+            with engine.connect() as conn:
+                display_summary(conn)
             
         except Exception as e:
+            if events:
+                print("\n".join(events), flush=True)
             print(f"❌ Error creating sample data: {e}")
-            db.rollback()
             raise
-        finally:
-            db.close()
             
     except Exception as e:
         print(f"❌ Database initialization failed: {e}")
@@ -599,7 +660,9 @@ def main():
         print("=" * 60)
         print("Available commands:")
         print("  python main_dashboard_init.py initdb    - Initialize database with sample data")
+        print("      --fast-seed                          - Drop indexes while seeding, rebuild after")
         print("  python main_dashboard_init.py reset     - Reset database (delete all data)")
+        print("      --full                               - Also drop and recreate all tables")
         print("  python main_dashboard_init.py test      - Test database connection")
         print("  python main_dashboard_init.py stats     - Show database statistics")
         print("  python main_dashboard_init.py backup    - Backup database")
@@ -609,7 +672,7 @@ def main():
     command = sys.argv[1].lower()
     
     if command == "initdb":
-        success = init_database()
+        success = init_database(fast_seed="--fast-seed" in sys.argv[2:])
         if success:
             print("\n🎉 Database initialization completed successfully!")
             print("🚀 Next steps:")
@@ -621,7 +684,7 @@ def main():
             sys.exit(1)
             
     elif command == "reset":
-        success = reset_database()
+        success = reset_database(full="--full" in sys.argv[2:])
         if success:
             print("\n🎉 Database reset completed!")
             print("💡 Run 'python main_dashboard_init.py initdb' to recreate sample data")
@@ -649,6 +712,9 @@ def main():
 
 def show_stats():
     """Show database statistics"""
+    from app.core.database import SessionLocal
+    from app.models.script import MP3File
+    
     try:
         print("📊 Database Statistics")
         print("=" * 40)
@@ -656,12 +722,9 @@ def show_stats():
         db = SessionLocal()
         
         # Basic counts
-        user_count = db.query(User).count()
-        product_count = db.query(Product).count()
-        script_count = db.query(Script).count()
-        mp3_count = db.query(MP3File).count() if 'MP3File' in globals() else 0
-        script_persona_count = db.query(ScriptPersona).count()
-        voice_persona_count = db.query(VoicePersona).count()
+        user_count, script_count, script_persona_count, voice_persona_count = get_table_counts(db)
+        product_count, active_products, on_sale_products, total_stock = get_product_breakdown(db)
+        mp3_count = db.query(MP3File).count()
         
         print(f"👥 Users: {user_count}")
         print(f"📦 Products: {product_count}")
@@ -672,19 +735,13 @@ def show_stats():
         
         if product_count > 0:
             print("\n📦 Product Breakdown:")
-            active_products = db.query(Product).filter(Product.status == ProductStatus.ACTIVE).count()
-            on_sale_products = db.query(Product).filter(Product.discount_percentage > 0).count()
-            total_stock = db.query(func.sum(Product.stock_quantity)).scalar() or 0
-            
             print(f"   ✅ Active: {active_products}")
             print(f"   🔥 On Sale: {on_sale_products}")
             print(f"   📦 Total Stock: {total_stock} units")
         
         if script_count > 0:
             print("\n📝 Script Breakdown:")
-            ai_scripts = db.query(Script).filter(Script.script_type == ScriptType.AI_GENERATED).count()
-            manual_scripts = db.query(Script).filter(Script.script_type == ScriptType.MANUAL).count()
-            scripts_with_mp3 = db.query(Script).filter(Script.has_mp3 == True).count()
+            ai_scripts, manual_scripts, scripts_with_mp3 = get_script_breakdown(db)
             
             print(f"   🤖 AI Generated: {ai_scripts}")
             print(f"   ✏️ Manual: {manual_scripts}")
@@ -704,12 +761,17 @@ def show_stats():
 
 def backup_database():
     """Backup database"""
+    from app.core.database import engine
+    
     try:
         import shutil
+        import sqlite3
         from datetime import datetime
         
         source = "ai_live_commerce.db"
-        if not os.path.exists(source):
+        try:
+            source_size = os.stat(source).st_size / (1 << 20)
+        except FileNotFoundError:
             print("❌ Database file not found")
             return
         
@@ -722,11 +784,21 @@ def backup_database():
         backup_path = f"backups/{backup_name}"
         
         # Copy database
-        shutil.copy2(source, backup_path)
+        if engine.dialect.name == "sqlite":
+            # Online backup API: page-level copy, consistent even while the DB is in use
+            src = sqlite3.connect(source)
+            dst = sqlite3.connect(backup_path)
+            try:
+                src.backup(dst, pages=1024)
+            finally:
+                dst.close()
+                src.close()
+        else:
+            with open(source, "rb") as fsrc, open(backup_path, "wb") as fdst:
+                shutil.copyfileobj(fsrc, fdst, length=16 * 1024 * 1024)
         
-        # Get file sizes
-        source_size = os.path.getsize(source) / 1024 / 1024
-        backup_size = os.path.getsize(backup_path) / 1024 / 1024
+        # Get backup file size
+        backup_size = os.stat(backup_path).st_size / (1 << 20)
         
         print(f"✅ Database backed up successfully!")
         print(f"📂 Source: {source} ({source_size:.2f} MB)")
@@ -737,6 +809,10 @@ def backup_database():
 
 def create_superuser():
     """Create superuser account"""
+    from app.core.database import SessionLocal
+    from app.models.user import User
+    from app.core.security import SecurityManager
+    
     try:
         print("👤 Create Superuser Account")
         print("=" * 30)
@@ -761,11 +837,11 @@ def create_superuser():
         db = SessionLocal()
         
         # Check if user exists
-        existing = db.query(User).filter(
+        exists_q = select(User.id).where(
             (User.email == email) | (User.username == username)
-        ).first()
+        ).limit(1)
         
-        if existing:
+        if db.execute(exists_q).first():
             print("❌ User with this email or username already exists")
             db.close()
             return
@@ -794,141 +870,4 @@ def create_superuser():
         print(f"❌ Error creating superuser: {e}")
 
 if __name__ == "__main__":
-    main()#!/usr/bin/env python3
-"""
-Database Initialization for AI Live Commerce Platform
-Creates tables, sample data, and default personas
-"""
-
-import sys
-import os
-from pathlib import Path
-from sqlalchemy.orm import Session
-from sqlalchemy import text
-import json
-
-# Add app directory to path
-sys.path.append(str(Path(__file__).parent))
-
-from app.core.database import engine, SessionLocal, create_tables
-from app.models.product import Product, ProductStatus
-from app.models.script import Script, ScriptPersona, VoicePersona, ScriptType, GenderType
-from app.models.user import User
-from app.core.security import SecurityManager
-
-def init_database():
-    """Initialize database with tables and sample data"""
-    print("🗄️ Initializing AI Live Commerce Database...")
-    print("=" * 60)
-    
-    try:
-        # Create all tables
-        print("📋 Creating database tables...")
-        create_tables()
-        print("✅ Database tables created successfully!")
-        
-        # Create session
-        db = SessionLocal()
-        
-        try:
-            # Create sample data
-            create_sample_personas(db)
-            create_sample_products(db)
-            create_sample_user(db)
-            create_sample_scripts(db)
-            
-            db.commit()
-            print("✅ All sample data created successfully!")
-            
-            # Display summary
-            display_summary(db)
-            
-        except Exception as e:
-            print(f"❌ Error creating sample data: {e}")
-            db.rollback()
-            raise
-        finally:
-            db.close()
-            
-    except Exception as e:
-        print(f"❌ Database initialization failed: {e}")
-        return False
-    
-    return True
-
-def create_sample_personas(db: Session):
-    """Create default script and voice personas"""
-    print("\n👤 Creating sample personas...")
-    
-    # Script Personas
-    script_personas = [
-        {
-            "name": "Energetic Seller",
-            "description": "เซลส์มันส์ที่มีพลังและความกระตือรือร้นสูง เหมาะสำหรับสินค้าที่ต้องการสร้างความตื่นเต้น",
-            "personality_traits": ["enthusiastic", "confident", "persuasive", "energetic", "positive"],
-            "speaking_style": "พูดเร็ว เต็มไปด้วยพลัง ใช้คำที่สร้างความตื่นเต้น",
-            "target_audience": "วัยรุ่น ผู้ซื้อแบบ impulse buy ผู้ที่ชอบความสนุก",
-            "system_prompt": """คุณเป็นเซลส์มันส์ที่มีพลังและความกระตือรือร้นสูงมาก พูดด้วยความตื่นเต้นและมั่นใจ ใช้คำเช่น 'สุดยอด', 'เจ๋งมาก', 'ไม่มีที่ไหนขายถูกกว่า', 'รีบๆ นะครับ' สร้างความเร่งด่วนด้วยโปรโมชั่นจำกัดเวลา แสดงความตื่นเต้นกับสินค้าและสร้างบรรยากาศสนุกสนาน
-
-อารมณ์: ตื่นเต้น กระตือรือร้น เป็นมิตร
-การพูด: เร็ว มีชีวิตชีวา ใช้อิโมจิและคำอุทาน
-เป้าหมาย: ทำให้ลูกค้ารู้สึกตื่นเต้นและอยากซื้อทันที""",
-            "sample_phrases": [
-                "สุดยอดมากครับ!", "เจ๋งจริงๆ เลย!", "ไม่เจอแบบนี้ที่ไหนแล้ว!", 
-                "รีบสั่งนะครับ เหลือไม่เยอะแล้ว!", "โอกาสทองอย่างนี้พลาดไม่ได้!"
-            ],
-            "tone_guidelines": "ใช้น้ำเสียงที่มีพลัง เร็ว และเต็มไปด้วยความตื่นเต้น",
-            "do_say": ["สุดยอด", "เจ๋งมาก", "รีบๆ", "โอกาสทอง", "พิเศษมาก", "ลดราคา", "ไม่ควรพลาด"],
-            "dont_say": ["อาจจะ", "ไม่แน่ใจ", "ทั่วไป", "ธรรมดา", "ช้าๆ"],
-            "default_emotion": "excited",
-            "available_emotions": ["excited", "energetic", "happy", "confident", "urgent"],
-            "sort_order": 1
-        },
-        {
-            "name": "Professional Advisor",
-            "description": "ที่ปรึกษาผลิตภัณฑ์มืออาชีพ ให้ข้อมูลที่ละเอียดและน่าเชื่อถือ",
-            "personality_traits": ["knowledgeable", "trustworthy", "detailed", "patient", "reliable"],
-            "speaking_style": "พูดชัดเจน ให้ข้อมูลละเอียด สร้างความน่าเชื่อถือ",
-            "target_audience": "ผู้ซื้อจริงจัง นักธุรกิจ ผู้ที่ต้องการข้อมูลครบถ้วน",
-            "system_prompt": """คุณเป็นที่ปรึกษาผลิตภัณฑ์มืออาชีพ ให้ข้อมูลที่ละเอียด ถูกต้อง และน่าเชื่อถือ เน้นคุณสมบัติ ประโยชน์ และคุณค่าของสินค้า อธิบายเทคนิคและรายละเอียดอย่างชัดเจน สร้างความเชื่อมั่นผ่านความเชี่ยวชาญ
-
-อารมณ์: มืออาชีพ สงบ น่าเชื่อถือ
-การพูด: ชัดเจน ละเอียด มีข้อมูลสนับสนุน
-เป้าหมาย: สร้างความไว้วางใจและให้ข้อมูลครบถ้วนเพื่อการตัดสินใจซื้อ""",
-            "sample_phrases": [
-                "จากประสบการณ์", "ข้อมูลที่ชัดเจน", "คุณสมบัติที่โดดเด่น", 
-                "ผลทดสอบแสดงให้เห็น", "เหมาะสำหรับผู้ที่ต้องการ"
-            ],
-            "tone_guidelines": "ใช้น้ำเสียงที่สงบ มั่นใจ และให้ข้อมูลอย่างชัดเจน",
-            "do_say": ["การันตี", "คุณภาพ", "มาตรฐาน", "ประสบการณ์", "เชื่อถือได้", "เหมาะสำหรับ"],
-            "dont_say": ["อาจจะดี", "ลองดู", "ไม่รู้", "ทั่วๆ ไป"],
-            "default_emotion": "professional",
-            "available_emotions": ["professional", "confident", "trustworthy", "calm"],
-            "sort_order": 2
-        },
-        {
-            "name": "Friendly Neighbor",
-            "description": "เพื่อนบ้านที่อยากแนะนำสินค้าดีๆ ด้วยความจริงใจ",
-            "personality_traits": ["caring", "honest", "relatable", "helpful", "warm"],
-            "speaking_style": "สบายๆ เป็นกันเอง แชร์ประสบการณ์ส่วนตัว",
-            "target_audience": "ครอบครัว แม่บ้าน ผู้ที่ชอบความอบอุ่น",
-            "system_prompt": """คุณเป็นเพื่อนบ้านที่อยากแชร์สินค้าดีๆ ด้วยความจริงใจ พูดแบบสบายๆ เป็นกันเอง แชร์ประสบการณ์ส่วนตัว เล่าว่าสินค้านี้ช่วยคุณอย่างไร สร้างความรู้สึกอบอุ่นและไว้วางใจ
-
-อารมณ์: เป็นมิตร อบอุ่น จริงใจ
-การพูด: สบายๆ เป็นกันเอง ใช้คำง่ายๆ
-เป้าหมาย: สร้างความรู้สึกเหมือนคำแนะนำจากเพื่อน""",
-            "sample_phrases": [
-                "บอกตามตรงนะ", "ใช้แล้วรู้สึกดี", "แนะนำจริงๆ", 
-                "เหมือนได้ของดีมาแชร์", "ลองดูนะ คุ้มจริงๆ"
-            ],
-            "tone_guidelines": "ใช้น้ำเสียงที่อบอุ่น เป็นกันเอง และจริงใจ",
-            "do_say": ["แนะนำ", "แชร์", "บอกต่อ", "ใช้ดี", "คุ้มค่า", "ลองดู"],
-            "dont_say": ["ต้องซื้อ", "รีบๆ", "บังคับ"],
-            "default_emotion": "friendly",
-            "available_emotions": ["friendly", "warm", "caring", "honest"],
-            "sort_order": 3
-        }
-    ]
-    
-    for persona_data in script_personas:
-        persona = ScriptPersona(**persona_data)
\ No newline at end of file
+    main()
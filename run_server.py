@@ -7,25 +7,39 @@ Optimized for Core i7 + 8GB RAM with comprehensive dashboard system
 import os
 import sys
 import time
-import psutil
+import functools
+import gzip
+import hashlib
+import itertools
+import logging
+import mimetypes
+import orjson
+import shutil
 import uvicorn
 import asyncio
+import anyio.to_thread
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timezone
 
 # Add the project root to the Python path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from fastapi import FastAPI, Request, HTTPException, Depends
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
+from starlette.datastructures import Headers
 from contextlib import asynccontextmanager
+from sqlalchemy import inspect, text
 
 from app.core.config import get_settings, print_startup_info, validate_openai_setup
-from app.core.database import engine, SessionLocal, Base, create_tables
-from app.models import *  # Import all models
+from app.core.database import engine, create_tables
+from app.core.health_interceptor import HealthCheckInterceptor
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
 
 # API Routers
 from app.api.v1.dashboard import router as dashboard_router
@@ -39,8 +53,154 @@ except ImportError as e:
     ai_script_service = None
 
 # Global variables for monitoring
-start_time = datetime.utcnow()
-request_count = 0
+start_time = datetime.now(timezone.utc)  # for display only
+_START_MONO = time.monotonic()  # for uptime / interval arithmetic
+# Request counter: next() on itertools.count is a single C-level increment
+_req_counter = itertools.count(1)
+_last_req = [0]
+
+# Worker threads for sync FastAPI dependencies and handlers
+THREADPOOL_SIZE = 100
+
+# Liveness probe statement, built once
+_HEALTH_STMT = text("SELECT 1")
+
+def _ping_db():
+    """SELECT 1 on a pooled connection (QueuePool, pre-ping; see app.core.database)"""
+    with engine.connect() as conn:
+        conn.execute(_HEALTH_STMT)
+
+# One process handle for the server's lifetime; cpu_percent() measures since
+# the previous call on the same handle, so a fresh Process() always reports 0.0
+@functools.lru_cache(maxsize=None)
+def _proc():
+    """psutil is imported on first use, not at server import"""
+    import psutil
+    return psutil.Process()
+
+_metric_cache = {}
+
+def _cached(ttl: float = 1.0):
+    """Memoize a zero-argument metric reader for ttl seconds"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper():
+            now = time.monotonic()
+            hit = _metric_cache.get(func.__name__)
+            if hit and now - hit[1] < ttl:
+                return hit[0]
+            value = func()
+            _metric_cache[func.__name__] = (value, now)
+            return value
+        return wrapper
+    return decorator
+
+# Byte -> MB/GB factors, so conversions are one multiply
+_MB = 1.0 / (1024 * 1024)
+_GB = 1.0 / (1024 ** 3)
+
+def _get_memory_mb() -> float:
+    return _proc().memory_info().rss * _MB
+
+# Process CPU % and RSS, refreshed by _process_sampler(); endpoints only read
+# _cpu[0] / _rss_mb[0] and never touch psutil themselves
+PROCESS_SAMPLE_INTERVAL = 5.0
+_cpu = [0.0]
+_rss_mb = [0.0]
+
+async def _process_sampler():
+    """cpu_percent(interval=None) measures since the previous call, so a
+    steady cadence yields a real reading without blocking a request"""
+    proc = _proc()
+    proc.cpu_percent(interval=None)  # first call only primes the counter
+    _rss_mb[0] = _get_memory_mb()
+    while True:
+        await asyncio.sleep(PROCESS_SAMPLE_INTERVAL)
+        info = proc.as_dict(attrs=["cpu_percent", "memory_info"])
+        _cpu[0] = info["cpu_percent"]
+        _rss_mb[0] = info["memory_info"].rss * _MB
+
+@_cached()
+def _get_vmem():
+    import psutil
+    return psutil.virtual_memory()
+
+# Disk usage moves slowly; refresh it twice a minute at most
+@_cached(ttl=30.0)
+def _get_disk_used_gb():
+    import psutil
+    return round(psutil.disk_usage('/').used * _GB, 2) if os.name != 'nt' else "N/A"
+
+@_cached()
+def _get_proc_handles():
+    """(threads, open files); open_files() walks /proc/self/fd, so it is TTL-cached too"""
+    info = _proc().as_dict(attrs=["num_threads", "open_files"])
+    return info["num_threads"], len(info["open_files"] or ())
+
+# Fixed for the life of the process
+_CPU_COUNT = os.cpu_count()
+
+_DB_PATH = Path("ai_live_commerce.db")
+
+# The file only grows with writes; health probes can see a 30s-old size
+@_cached(ttl=30.0)
+def _db_size_mb() -> float:
+    return round(_DB_PATH.stat().st_size * _MB, 2) if _DB_PATH.exists() else 0
+
+# Runtime directories; these don't move between deployments
+_REQUIRED_DIRS = [
+    Path(d) for d in (
+        "frontend/uploads/images",
+        "frontend/uploads/videos",
+        "frontend/static/audio",
+        "logs",
+    )
+]
+
+# Performance targets ("Optimized for Core i7 + 8GB RAM")
+MEMORY_TARGET_MB = 300
+MEMORY_HIGH_MB = 400
+MEMORY_EXCELLENT_MB = 250
+STARTUP_TARGET_S = 30
+RESPONSE_TIME_TARGET_MS = 500
+
+_PERFORMANCE_TARGETS = {
+    "startup_time_target": STARTUP_TARGET_S,  # seconds
+    "memory_target": MEMORY_TARGET_MB,        # MB
+    "response_time_target": RESPONSE_TIME_TARGET_MS  # ms
+}
+
+# Constant parts of the /api/health body, built once
+_HEALTH_STATIC = {
+    "status": "healthy",
+    "phase": "Dashboard + AI Integration",
+    "version": "2.0.0",
+}
+
+# performance_target block, keyed by whether the targets are met
+_HEALTH_TARGETS = {
+    met: {
+        "status": "✅ MEETING TARGETS" if met else "⚠️ CHECK PERFORMANCE",
+        "memory_target": f"< {MEMORY_TARGET_MB}MB",
+        "startup_target": f"< {STARTUP_TARGET_S} seconds"
+    }
+    for met in (True, False)
+}
+
+# /api/health feature map, pre-built for each AI mode
+_HEALTH_FEATURES = {
+    mode: {
+        "dashboard": "✅ Active",
+        "ai_integration": f"✅ Active ({mode})",
+        "tts_system": "✅ Active",
+        "product_management": "✅ Active"
+    }
+    for mode in ("openai", "simulation")
+}
+
+def _write_lines(lines):
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -51,89 +211,119 @@ async def lifespan(app: FastAPI):
     # Print startup information
     print_startup_info()
     
+    # Startup report is collected and written to stdout in one call
+    lines = []
+    out = lines.append
+    
     # Validate OpenAI setup
-    print("\n🔍 Validating OpenAI Integration...")
+    out("\n🔍 Validating OpenAI Integration...")
     openai_status = validate_openai_setup()
     if openai_status['configured']:
-        print("✅ OpenAI integration configured properly")
+        out("✅ OpenAI integration configured properly")
     else:
-        print("⚠️ OpenAI integration issues found:")
+        out("⚠️ OpenAI integration issues found:")
         for issue in openai_status['issues']:
-            print(f"   - {issue}")
-        print("💡 AI script generation will use simulation mode")
+            out(f"   - {issue}")
+        out("💡 AI script generation will use simulation mode")
     
-    # Initialize database
-    print("\n🗄️ Initializing database...")
-    try:
-        create_tables()
-        print("✅ Database tables initialized")
-    except Exception as e:
-        print(f"❌ Database initialization failed: {e}")
-        sys.exit(1)
+    # Sync dependencies/handlers run on AnyIO's worker threads (default 40)
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
     
-    # Create required directories
-    print("\n📁 Creating required directories...")
-    directories = [
-        "frontend/uploads/images",
-        "frontend/uploads/videos", 
-        "frontend/static/audio",
-        "logs"
-    ]
+    # Dashboard page is served from memory, with a validator for conditional GETs
+    app.state.dashboard_html = _load_dashboard_html()
+    app.state.dashboard_etag = '"%s"' % hashlib.md5(app.state.dashboard_html, usedforsecurity=False).hexdigest()
+    app.state.dashboard_html_gz = gzip.compress(app.state.dashboard_html, compresslevel=9)
     
-    for directory in directories:
-        Path(directory).mkdir(parents=True, exist_ok=True)
-        print(f"   ✅ {directory}")
+    def _init_db() -> str:
+        # create_all is idempotent but still probes every table; skip it once the DB exists
+        if inspect(engine).has_table("script_personas"):
+            return "✅ Database tables already present"
+        create_tables()
+        return "✅ Database tables initialized"
     
-    # Test services
-    print("\n🧪 Testing services...")
-    if ai_script_service:
+    async def _probe_openai():
+        if not ai_script_service:
+            return "   ⚠️ AI Script Service not available"
         try:
             connection_test = await ai_script_service.test_openai_connection()
             if connection_test["status"] == "connected":
-                print("   ✅ OpenAI API connection successful")
-            else:
-                print(f"   ⚠️ OpenAI API: {connection_test['message']}")
+                return "   ✅ OpenAI API connection successful"
+            return f"   ⚠️ OpenAI API: {connection_test['message']}"
         except Exception as e:
-            print(f"   ⚠️ OpenAI test failed: {e}")
-    else:
-        print("   ⚠️ AI Script Service not available")
+            return f"   ⚠️ OpenAI test failed: {e}"
+    
+    # Only directories that are actually missing (i.e. first boot) get created
+    missing = [p for p in _REQUIRED_DIRS if not p.is_dir()]
+    
+    # None of these depend on each other: the OpenAI round-trip overlaps with
+    # database setup and directory creation, which run in worker threads
+    db_result, openai_result, *mkdir_results = await asyncio.gather(
+        asyncio.to_thread(_init_db),
+        _probe_openai(),
+        *(asyncio.to_thread(p.mkdir, parents=True, exist_ok=True) for p in missing),
+        return_exceptions=True
+    )
+    
+    out("\n🗄️ Initializing database...")
+    if isinstance(db_result, Exception):
+        out(f"❌ Database initialization failed: {db_result}")
+        _write_lines(lines)
+        sys.exit(1)
+    out(db_result)
+    
+    for err in mkdir_results:
+        if isinstance(err, Exception):
+            _write_lines(lines)
+            raise err
+    
+    if missing:
+        out("\n📁 Creating required directories...")
+        for p in missing:
+            out(f"   ✅ {p.as_posix()}")
+    
+    # Test services
+    out("\n🧪 Testing services...")
+    out(openai_result)
     
     # Calculate startup time and memory usage
-    startup_duration = (datetime.utcnow() - start_time).total_seconds()
-    memory_usage = psutil.Process().memory_info().rss / 1024 / 1024  # MB
-    
-    print("\n" + "=" * 80)
-    print("🎉 AI Live Commerce Platform Ready!")
-    print("=" * 80)
-    print(f"📱 Dashboard: http://localhost:{get_settings().PORT}")
-    print(f"📚 API Docs: http://localhost:{get_settings().PORT}/docs")  
-    print(f"🔧 Health Check: http://localhost:{get_settings().PORT}/api/health")
-    print(f"📊 System Info: http://localhost:{get_settings().PORT}/api/system/info")
-    print("=" * 80)
-    print(f"⚡ Startup time: {startup_duration:.2f}s")
-    print(f"💾 Memory usage: {memory_usage:.1f}MB")
-    print(f"🎯 Performance targets: {'✅ MEETING' if startup_duration < 30 and memory_usage < 300 else '⚠️ NOT MEETING'}")
-    print("=" * 80)
+    startup_duration = time.monotonic() - _START_MONO
+    memory_usage = _get_memory_mb()  # MB
+    
+    out("\n" + "=" * 80)
+    out("🎉 AI Live Commerce Platform Ready!")
+    out("=" * 80)
+    out(f"📱 Dashboard: http://localhost:{settings.PORT}")
+    out(f"📚 API Docs: http://localhost:{settings.PORT}/docs")  
+    out(f"🔧 Health Check: http://localhost:{settings.PORT}/api/health")
+    out(f"📊 System Info: http://localhost:{settings.PORT}/api/system/info")
+    out("=" * 80)
+    out(f"⚡ Startup time: {startup_duration:.2f}s")
+    out(f"💾 Memory usage: {memory_usage:.1f}MB")
+    out(f"🎯 Performance targets: {'✅ MEETING' if startup_duration < STARTUP_TARGET_S and memory_usage < MEMORY_TARGET_MB else '⚠️ NOT MEETING'}")
+    out("=" * 80)
+    
+    _write_lines(lines)
+    
+    process_sampler = asyncio.create_task(_process_sampler())
     
     yield  # Application runs here
     
     # Cleanup on shutdown
     print("\n🛑 Shutting down AI Live Commerce Platform...")
+    process_sampler.cancel()
     print("✅ Cleanup completed")
 
 # Initialize FastAPI app
-app = FastAPI(
+fastapi_app = FastAPI(
     title="AI Live Commerce Platform",
     description="Advanced AI-powered live commerce platform with real-time script generation",
     version="2.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
-# Get settings
-settings = get_settings()
-
 # Add middleware
-app.add_middleware(
+fastapi_app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.CORS_ORIGINS,
     allow_credentials=settings.CORS_ALLOW_CREDENTIALS,
@@ -141,45 +331,121 @@ app.add_middleware(
     allow_headers=settings.CORS_ALLOW_HEADERS,
 )
 
+class SelectiveGZipMiddleware(GZipMiddleware):
+    """GZip for API JSON and HTML, skipping responses that must not be
+    recompressed (the pre-gzipped dashboard, static/upload files) or
+    buffered (the SSE streams)"""
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            path = scope["path"]
+            if path == "/" or path.startswith(_NO_GZIP_PREFIXES):
+                await self.app(scope, receive, send)
+                return
+        await super().__call__(scope, receive, send)
+
+_NO_GZIP_PREFIXES = ("/static/", "/uploads/", "/api/v1/stream/", "/api/facebook/live/comments/stream")
+
+fastapi_app.add_middleware(SelectiveGZipMiddleware, minimum_size=512, compresslevel=4)
+
+class SetTrustedHostMiddleware(TrustedHostMiddleware):
+    """Exact host names are a frozenset lookup; wildcard patterns and
+    rejections fall through to Starlette's per-pattern scan"""
+    
+    def __init__(self, app, allowed_hosts=None, www_redirect=True):
+        super().__init__(app, allowed_hosts=allowed_hosts, www_redirect=www_redirect)
+        self.exact_hosts = frozenset(h for h in self.allowed_hosts if not h.startswith("*"))
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] in ("http", "websocket"):
+            for name, value in scope["headers"]:
+                if name == b"host":
+                    if value.decode("latin-1").split(":")[0] in self.exact_hosts:
+                        await self.app(scope, receive, send)
+                        return
+                    break
+        await super().__call__(scope, receive, send)
+
 if not settings.DEBUG:
-    app.add_middleware(
-        TrustedHostMiddleware,
+    fastapi_app.add_middleware(
+        SetTrustedHostMiddleware,
         allowed_hosts=settings.ALLOWED_HOSTS.split(",") if isinstance(settings.ALLOWED_HOSTS, str) else settings.ALLOWED_HOSTS
     )
 
+_UNTIMED_PATHS = ("/static/", "/uploads/")
+
 # Request counter middleware
-@app.middleware("http")
+@fastapi_app.middleware("http")
 async def count_requests(request: Request, call_next):
-    global request_count
-    request_count += 1
-    start_time_req = time.time()
-    
-    response = await call_next(request)
+    _last_req[0] = next(_req_counter)
+    # Static files are counted but not timed (health probes never get here:
+    # HealthCheckInterceptor answers them in front of the app)
+    if request.url.path.startswith(_UNTIMED_PATHS):
+        response = await call_next(request)
+    else:
+        start_ns = time.perf_counter_ns()
+        
+        response = await call_next(request)
+        
+        response.headers["X-Process-Time"] = f"{(time.perf_counter_ns() - start_ns) / 1e9:.6f}"
     
-    process_time = time.time() - start_time_req
-    response.headers["X-Process-Time"] = str(process_time)
+    # uvicorn's per-request access log is off; only failed requests are logged
+    if response.status_code >= 400:
+        logger.warning('"%s %s" %d', request.method, request.url.path, response.status_code)
     
     return response
 
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles with a Cache-Control policy and precompressed .gz siblings"""
+    
+    def __init__(self, *args, cache_control: str, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cache_control = cache_control
+    
+    def file_response(self, full_path, stat_result, scope, status_code=200):
+        gz_stat = None
+        if "gzip" in Headers(scope=scope).get("accept-encoding", ""):
+            try:
+                gz_stat = os.stat(f"{full_path}.gz")
+            except OSError:
+                pass
+        
+        if gz_stat is not None:
+            response = super().file_response(f"{full_path}.gz", gz_stat, scope, status_code)
+            response.headers["Content-Encoding"] = "gzip"
+            media_type = mimetypes.guess_type(str(full_path))[0]
+            if media_type and "content-type" in response.headers:
+                response.headers["Content-Type"] = media_type
+        else:
+            response = super().file_response(full_path, stat_result, scope, status_code)
+        
+        response.headers["Cache-Control"] = self.cache_control
+        response.headers["Vary"] = "Accept-Encoding"
+        return response
+
 # Mount static files
-app.mount("/static", StaticFiles(directory="frontend/static"), name="static")
-app.mount("/uploads", StaticFiles(directory="frontend/uploads"), name="uploads")
+# Script audio is regenerated under the same name, so browsers revalidate it
+# (ETag / Last-Modified -> 304); uploads get unique names and never change.
+# Behind nginx (SERVE_STATIC=false) these are sent with sendfile() and never reach Python.
+if settings.DEBUG or settings.SERVE_STATIC:
+    fastapi_app.mount("/static", CachedStaticFiles(directory="frontend/static", cache_control="no-cache"), name="static")
+    fastapi_app.mount(
+        "/uploads",
+        CachedStaticFiles(
+            directory="frontend/uploads",
+            cache_control="public, max-age=31536000, immutable"
+        ),
+        name="uploads"
+    )
 
 # Include API routers
-app.include_router(dashboard_router, prefix="/api/v1", tags=["Dashboard"])
+fastapi_app.include_router(dashboard_router, prefix="/api/v1", tags=["Dashboard"])
 
 # Root endpoint - Dashboard
-@app.get("/", response_class=HTMLResponse)
-async def dashboard():
-    """Main dashboard page"""
-    try:
-        dashboard_path = Path("frontend/dashboard/index.html")
-        if dashboard_path.exists():
-            with open(dashboard_path, 'r', encoding='utf-8') as f:
-                return HTMLResponse(content=f.read())
-        else:
-            # Fallback simple dashboard
-            return HTMLResponse(content="""
+DASHBOARD_PATH = Path("frontend/dashboard/index.html")
+
+# Fallback dashboard served when frontend/dashboard/index.html is missing
+_FALLBACK_DASHBOARD_HTML = """
 <!DOCTYPE html>
 <html>
 <head>
@@ -243,47 +509,59 @@ async def dashboard():
     </div>
     
     <script>
-        // Auto-refresh system status
-        async function updateStatus() {
-            try {
-                const response = await fetch('/api/v1/dashboard/ai-status');
-                const status = await response.json();
-                console.log('AI Status:', status);
-            } catch (error) {
-                console.error('Status check failed:', error);
-            }
-        }
-        
-        // Update status every 30 seconds
-        setInterval(updateStatus, 30000);
-        updateStatus(); // Initial check
+        // AI status is pushed by the server whenever it changes
+        const statusStream = new EventSource('/api/v1/stream/ai-status');
+        statusStream.onmessage = (event) => {
+            console.log('AI Status:', JSON.parse(event.data));
+        };
+        statusStream.onerror = () => {
+            console.error('Status stream interrupted, reconnecting...');
+        };
     </script>
 </body>
 </html>
-            """)
-    except Exception as e:
-        return HTMLResponse(content=f"<h1>Error loading dashboard</h1><p>{str(e)}</p>", status_code=500)
+"""
+
+def _load_dashboard_html() -> bytes:
+    """Dashboard page bytes; read once at startup and served from memory"""
+    try:
+        if DASHBOARD_PATH.exists():
+            return DASHBOARD_PATH.read_bytes()
+    except OSError as e:
+        print(f"⚠️ Could not read {DASHBOARD_PATH}: {e}")
+    return _FALLBACK_DASHBOARD_HTML.encode("utf-8")
+
+_DASHBOARD_CACHE_CONTROL = "public, max-age=60"
+
+@fastapi_app.get("/", response_class=HTMLResponse)
+async def dashboard(request: Request):
+    """Main dashboard page"""
+    etag = fastapi_app.state.dashboard_etag
+    headers = {"ETag": etag, "Cache-Control": _DASHBOARD_CACHE_CONTROL, "Vary": "Accept-Encoding"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        headers["Content-Encoding"] = "gzip"
+        return HTMLResponse(content=fastapi_app.state.dashboard_html_gz, headers=headers)
+    return HTMLResponse(content=fastapi_app.state.dashboard_html, headers=headers)
 
 # Health check endpoints
-@app.get("/api/health")
+@fastapi_app.get("/api/health")
 async def health_check():
     """Enhanced health check"""
     
     # Get memory and CPU info
-    process = psutil.Process()
-    memory_mb = process.memory_info().rss / 1024 / 1024
-    cpu_percent = process.cpu_percent()
-    uptime = (datetime.utcnow() - start_time).total_seconds()
+    memory_mb = _rss_mb[0]
+    cpu_percent = _cpu[0]
+    uptime = time.monotonic() - _START_MONO
     
     # Check database connection
     try:
-        db = SessionLocal()
-        db.execute("SELECT 1")
-        db.close()
+        await asyncio.to_thread(_ping_db)
         db_connected = True
         db_info = {
             "type": "SQLite",
-            "size_mb": round(Path("ai_live_commerce.db").stat().st_size / (1024*1024), 2) if Path("ai_live_commerce.db").exists() else 0
+            "size_mb": _db_size_mb()
         }
     except Exception as e:
         db_connected = False
@@ -301,26 +579,17 @@ async def health_check():
     
     # Performance assessment
     performance_status = "good"
-    if memory_mb > 400:
+    if memory_mb > MEMORY_HIGH_MB:
         performance_status = "high_memory"
-    elif uptime > 0 and uptime < 30:
+    elif 0 < uptime < STARTUP_TARGET_S:
         performance_status = "fast_startup"
-    elif memory_mb < 250:
+    elif memory_mb < MEMORY_EXCELLENT_MB:
         performance_status = "excellent"
     
-    performance_target = "✅ MEETING TARGETS" if memory_mb < 300 and uptime < 30 else "⚠️ CHECK PERFORMANCE"
-    
     return {
-        "status": "healthy",
-        "timestamp": datetime.utcnow().isoformat(),
-        "phase": "Dashboard + AI Integration",
-        "version": "2.0.0",
-        "features": {
-            "dashboard": "✅ Active",
-            "ai_integration": f"✅ Active ({ai_mode})",
-            "tts_system": "✅ Active",
-            "product_management": "✅ Active"
-        },
+        **_HEALTH_STATIC,
+        "timestamp": datetime.now(timezone.utc),
+        "features": _HEALTH_FEATURES[ai_mode],
         "database": {
             "connected": db_connected,
             "info": db_info
@@ -329,7 +598,7 @@ async def health_check():
             "memory_mb": round(memory_mb, 1),
             "cpu_percent": cpu_percent,
             "uptime_seconds": round(uptime, 1),
-            "request_count": request_count,
+            "request_count": _last_req[0],
             "memory_status": performance_status
         },
         "ai_service": {
@@ -337,40 +606,38 @@ async def health_check():
             "mode": ai_mode,
             "available": ai_script_service is not None
         },
-        "performance_target": {
-            "status": performance_target,
-            "memory_target": "< 300MB",
-            "startup_target": "< 30 seconds"
-        }
+        "performance_target": _HEALTH_TARGETS[memory_mb < MEMORY_TARGET_MB and uptime < STARTUP_TARGET_S]
     }
 
-@app.get("/api/system/info")
-async def system_info():
+@fastapi_app.get("/api/system/info")
+def system_info():
     """Detailed system information"""
     
-    process = psutil.Process()
+    process = _proc()
+    vmem = _get_vmem()
+    threads, open_files = _get_proc_handles()
     
     return {
         "application": {
             "name": "AI Live Commerce Platform", 
             "version": "2.0.0",
-            "start_time": start_time.isoformat(),
-            "uptime_seconds": (datetime.utcnow() - start_time).total_seconds()
+            "start_time": start_time,
+            "uptime_seconds": time.monotonic() - _START_MONO
         },
         "system": {
             "python_version": sys.version,
             "platform": sys.platform,
-            "cpu_count": psutil.cpu_count(),
-            "memory_total_gb": round(psutil.virtual_memory().total / (1024**3), 2),
-            "memory_available_gb": round(psutil.virtual_memory().available / (1024**3), 2),
-            "disk_usage_gb": round(psutil.disk_usage('/').used / (1024**3), 2) if os.name != 'nt' else "N/A"
+            "cpu_count": _CPU_COUNT,
+            "memory_total_gb": round(vmem.total * _GB, 2),
+            "memory_available_gb": round(vmem.available * _GB, 2),
+            "disk_usage_gb": _get_disk_used_gb()
         },
         "process": {
             "pid": process.pid,
-            "memory_mb": round(process.memory_info().rss / (1024**2), 2),
-            "cpu_percent": process.cpu_percent(),
-            "threads": process.num_threads(),
-            "open_files": len(process.open_files()) if hasattr(process, 'open_files') else 0
+            "memory_mb": round(_rss_mb[0], 2),
+            "cpu_percent": _cpu[0],
+            "threads": threads,
+            "open_files": open_files
         },
         "configuration": {
             "debug": settings.DEBUG,
@@ -385,72 +652,65 @@ async def system_info():
         }
     }
 
-@app.get("/api/system/performance")
+@fastapi_app.get("/api/system/performance")
 async def system_performance():
     """Performance metrics"""
     
-    process = psutil.Process()
-    memory_mb = process.memory_info().rss / 1024 / 1024
-    uptime = (datetime.utcnow() - start_time).total_seconds()
-    
-    # Performance targets
-    targets = {
-        "startup_time_target": 30,  # seconds
-        "memory_target": 300,       # MB
-        "response_time_target": 500 # ms
-    }
+    memory_mb = _rss_mb[0]
+    uptime = time.monotonic() - _START_MONO
     
     # Current metrics
     metrics = {
         "memory_usage_mb": round(memory_mb, 1),
         "startup_time_seconds": round(uptime, 1) if uptime < 60 else "running",
-        "cpu_percent": process.cpu_percent(),
-        "request_count": request_count,
+        "cpu_percent": _cpu[0],
+        "request_count": _last_req[0],
         "uptime_minutes": round(uptime / 60, 1)
     }
     
     # Performance assessment
     assessment = {
-        "memory_status": "✅ Good" if memory_mb < targets["memory_target"] else "⚠️ High",
-        "startup_status": "✅ Good" if uptime < targets["startup_time_target"] or uptime > 60 else "⚠️ Slow",
-        "overall_status": "✅ Meeting Targets" if memory_mb < targets["memory_target"] else "⚠️ Check Performance"
+        "memory_status": "✅ Good" if memory_mb < MEMORY_TARGET_MB else "⚠️ High",
+        "startup_status": "✅ Good" if uptime < STARTUP_TARGET_S or uptime > 60 else "⚠️ Slow",
+        "overall_status": "✅ Meeting Targets" if memory_mb < MEMORY_TARGET_MB else "⚠️ Check Performance"
     }
     
     return {
-        "targets": targets,
+        "targets": _PERFORMANCE_TARGETS,
         "current_metrics": metrics,
         "assessment": assessment,
         "recommendations": [
-            "Memory usage is optimal" if memory_mb < 250 else "Consider memory optimization" if memory_mb > 400 else "Memory usage acceptable",
-            "Performance targets met" if memory_mb < targets["memory_target"] else "Review memory usage patterns",
+            "Memory usage is optimal" if memory_mb < MEMORY_EXCELLENT_MB else "Consider memory optimization" if memory_mb > MEMORY_HIGH_MB else "Memory usage acceptable",
+            "Performance targets met" if memory_mb < MEMORY_TARGET_MB else "Review memory usage patterns",
             f"Server has been running for {round(uptime/60, 1)} minutes"
         ]
     }
 
 # Error handlers
-@app.exception_handler(404)
+# 404 body is serialized once; only the path placeholder changes per request
+_NOT_FOUND_TEMPLATE = orjson.dumps({
+    "error": "Not Found",
+    "message": "The requested resource was not found",
+    "path": "__PATH__",
+    "available_endpoints": [
+        "/",
+        "/docs",
+        "/api/health",
+        "/api/system/info",
+        "/api/v1/dashboard/stats"
+    ]
+})
+
+@fastapi_app.exception_handler(404)
 async def not_found_handler(request: Request, exc: HTTPException):
     """Custom 404 handler"""
-    return JSONResponse(
-        status_code=404,
-        content={
-            "error": "Not Found",
-            "message": "The requested resource was not found",
-            "path": str(request.url.path),
-            "available_endpoints": [
-                "/",
-                "/docs",
-                "/api/health", 
-                "/api/system/info",
-                "/api/v1/dashboard/stats"
-            ]
-        }
-    )
+    body = _NOT_FOUND_TEMPLATE.replace(b'"__PATH__"', orjson.dumps(request.url.path), 1)
+    return Response(content=body, status_code=404, media_type="application/json")
 
-@app.exception_handler(500)
+@fastapi_app.exception_handler(500)
 async def internal_error_handler(request: Request, exc: Exception):
     """Custom 500 handler"""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": "Internal Server Error",
@@ -460,6 +720,32 @@ async def internal_error_handler(request: Request, exc: Exception):
         }
     )
 
+# Monitoring probes are answered before the FastAPI middleware/routing stack;
+# uvicorn and gunicorn load this wrapper as run_server:app
+app = HealthCheckInterceptor(fastapi_app, {
+    "/api/health": health_check,
+    "/api/system/performance": system_performance,
+})
+
+def _exec_gunicorn():
+    """Replace this process with gunicorn running UvicornWorkers.
+
+    Workers are recycled after ~1000 requests to keep RSS within the memory
+    target, and restarted gracefully on timeout.
+    """
+    os.execvp("gunicorn", [
+        "gunicorn", "run_server:app",
+        "--worker-class", "uvicorn.workers.UvicornWorker",
+        "--workers", str(settings.WORKERS),
+        "--bind", f"{settings.HOST}:{settings.PORT}",
+        "--max-requests", "1000",
+        "--max-requests-jitter", "50",
+        "--timeout", "120",
+        "--graceful-timeout", "30",
+        "--keep-alive", "5",
+        "--log-level", settings.LOG_LEVEL.lower(),
+    ])
+
 def main():
     """Main server entry point"""
     
@@ -473,16 +759,27 @@ def main():
         print("📊 Phase: Dashboard + AI Script Generation")
         print("=" * 80)
         
+        # Production: multi-process gunicorn (POSIX only); debug keeps uvicorn + reload
+        if not settings.DEBUG and settings.WORKERS > 1 and sys.platform != "win32" and shutil.which("gunicorn"):
+            _exec_gunicorn()
+        
         # Run the server
+        reload = settings.DEBUG and settings.RELOAD == "true"
         uvicorn.run(
             "run_server:app",
             host=settings.HOST,
             port=settings.PORT,
-            reload=settings.DEBUG and settings.RELOAD == "true",
+            reload=reload,
+            # Watch only the Python package: uploads, generated audio and the
+            # frontend tree would otherwise wake the reloader on every write
+            reload_dirs=["app"] if reload else None,
+            reload_excludes=["*.mp3", "*.png", "*.jpg", "*.db", "*.db-*"] if reload else None,
             workers=1 if settings.DEBUG else settings.WORKERS,
             log_level=settings.LOG_LEVEL.lower(),
-            access_log=settings.DEBUG,
-            loop="asyncio"
+            access_log=False,  # count_requests logs 4xx/5xx responses
+            # uvloop is POSIX-only; Windows keeps the stdlib event loop
+            loop="asyncio" if sys.platform == "win32" else "uvloop",
+            http="httptools"
         )
         
     except KeyboardInterrupt: